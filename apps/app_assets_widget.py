@@ -1,10 +1,12 @@
-from collections import OrderedDict
-from datetime import datetime
+from bisect import bisect_right
+from contextlib import contextmanager
 from send2trash import send2trash
 
 from PySide6 import QtCore, QtWidgets, QtGui
 
 from app_extra_widget import EZMScreenshotEdit, EZMDateDialog
+from core import AssetRecord, StructRecord, VersionRecord, record_property, parse_date, format_date, path_key, timestamp_date
+from storage import FileScanner, PathValidator, FolderWatcher, ThumbnailLoader, STORE_SORT
 from util import *
 
 import subprocess
@@ -15,6 +17,10 @@ DEBUG = True
 
 COMPATIBLE_FILE = ['.ma', '.mb', '.fbx']
 INVALID_FILENAME_CHARACTERS = ['\\','/',':','*','?','"','<','>','|']
+IMPORT_BATCH = 500  # asset created between event loop pass while importing
+DUPLICATE_LISTED = 10   # duplicate path named in import summary, the rest only counted
+REPOSITION_LIMIT = 32   # edited asset moved one by one up to this, more than this sort everything
+PREVIEW_SIZE = 200  # preview in asset detail fit inside this square
 
 class EZMAssetManager(QtWidgets.QWidget):
     def __init__(self, app=None):
@@ -66,10 +72,7 @@ class EZMAssetManager(QtWidgets.QWidget):
                 self.asset_detail.updated_lbl.setText("Last Updated: N/A")
             else:
                 self.asset_detail.updated_lbl.setText("Last Updated: %s"%asset[-1].date_modified)
-            if os.path.exists(asset[-1].preview):
-                self.asset_detail.thumbnail_lbl.change_icon(asset[-1].preview,(200,200)) # try to scale it for better view, the size.x and size.y doesn't matter cuz it will adapt to img ratio
-            else:
-                self.asset_detail.thumbnail_lbl.change_icon(get_path('no_preview.png', icon=True),(160,160)) 
+            self.asset_detail.show_preview(asset[-1].preview)
             if asset[-1].notes:
                 self.asset_detail.notes_edit.setPlainText(asset[-1].notes)
             else:
@@ -126,10 +129,9 @@ class EZMAssetBrowser(QtWidgets.QWidget):
     def deserialize(self, data):
         pass
 
-class EZMAssetScroll(QtWidgets.QScrollArea):
+class EZMAssetScroll(QtWidgets.QWidget):
     def __init__(self, app, manager, browser):
         super().__init__()
-        self.setWidgetResizable(True)
         self.setAcceptDrops(True)
 
         self.app = app
@@ -138,6 +140,10 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
 
         self._hint = True # show guide if true
         self._current_project = None
+        self.batch_depth = 0    # onModified wait until outermost batch end
+        self.batch_modified = False
+        self.changed_asset = [] # edited asset waiting to be moved to its sorted place
+        self.shown_filter = None    # (model revision, tab, search text) rows were last hidden for
 
         self.initUI()
         self.initConnection()
@@ -169,12 +175,8 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         else: self.refresh() # if project not set with different project, just refresh
 
     def initUI(self):
-        self.center_widget = QtWidgets.QWidget()
-        self.setWidget(self.center_widget)
-
-        self.main_layout = QtWidgets.QVBoxLayout(self.center_widget)
+        self.main_layout = QtWidgets.QVBoxLayout(self)
         self.main_layout.setContentsMargins(0,0,0,0)
-        #self.main_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
 
         self.import_btn = QtWidgets.QPushButton('import file')
         self.import_btn.setStyle(QtWidgets.QStyleFactory.create('Windows'))
@@ -183,9 +185,9 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         self.search_field.setPlaceholderText('Search')
         self.search_field.returnPressed.connect(self.search_field.clearFocus)
         self.search_field.textChanged.connect(self.toggle_asset_visibility)
-        self.asset_container = custom_widget.InteractiveItemContainer()
+        self.asset_container = EZMAssetListView()   # virtualized list, only visible row is painted
         self.asset_container.onModifySelectedItem = self.selectionModified
-        self.asset_container.main_layout.setContentsMargins(0,0,0,0)
+        self.asset_container.onClickEmpty = self.mousePressEvent
 
         # placeholder on empty project
         self.drag_guide = custom_widget.GraphicLabel(get_path('drag.png', icon=True),(128,128))
@@ -193,7 +195,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         # add widget to layout
         self.main_layout.addWidget(self.import_btn)
         self.main_layout.addWidget(self.search_field)
-        self.main_layout.addWidget(self.asset_container)
+        self.main_layout.addWidget(self.asset_container, 1)  # stretch factor to take all space from stretch below
         self.main_layout.addStretch()
         self.main_layout.addWidget(self.drag_guide, alignment=QtCore.Qt.AlignmentFlag.AlignCenter)
         self.main_layout.addStretch()
@@ -202,106 +204,129 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         # extra dialog/widget
         self.group_dialog = EZMQueryAssetGroup(self)
         self.date_dialog = EZMDateDialog(self)
+        self.file_scanner = FileScanner()
+        self.path_validator = PathValidator()   # path of opened project is checked in background
+        self.folder_watcher = FolderWatcher()   # changed folder on disk update its asset without refresh
+        self.watched_asset = {} # normcase folder : {asset: True} with path inside
+        self.watched_folder = {}    # normcase folder : folder passed to watcher
+        self.asset_folders = {} # asset : normcase folder it's watched under
+        self.rewatch_asset = {} # asset whose path changed since last watch update
+        self.watch_revision = None  # model revision of last watch update, row added or removed after it is watched on next update
+        self.importer = None    # running EZMAssetImport
 
     def initConnection(self):
         self.import_btn.clicked.connect(self.import_file)
+        self.folder_watcher.changed.connect(self.folders_changed)
 
-    def onModified(self):
+    def onModified(self, changed=None):
+        """changed is edited asset, moved to its place in current sort order"""
+        if changed: self.changed_asset.extend(changed)
+        if self.batch_depth:
+            self.batch_modified = True
+            return
+        changed, self.changed_asset = self.changed_asset, []
+        if changed: self.reposition_asset(changed)
         self.toggle_asset_visibility()
         self.current_project.browser.onModified(self.current_project)
         self.manager.update_asset_detail(self.asset_container.selected_item)
-        # eval all asset: (# cause some lag with file more than 200+)
-        self.refresh()
+        # eval all asset from cached folder listing, only folder not read recently hit the disk
+        self.refresh(reload=False)
+        self.update_watch()
                 
+    @contextmanager
+    def batch(self):
+        """command changing many asset run inside batch, calendar refresh, visibility, eval and save run once at the end"""
+        self.batch_depth += 1
+        try:
+            with self.app.calendar_editor.hold_update():
+                yield
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth and self.batch_modified:
+                self.batch_modified = False
+                self.onModified()
+
     def initProjectAsset(self):
         """Initialize asset when being shown/active, check for error if not valid"""
-        for asset in self.current_project.asset:
-            #if DEBUG: print('   load asset: %s'%asset.name)
-            #asset.asset_scroll = self # already in deserialize project
-            self.asset_container.add_item(asset)
-            asset.eval()
+        self.asset_container.add_items(self.current_project.asset)  # single model insert instead of one widget per asset
+        self.validate_asset(self.current_project.asset)
+        self.watch_asset()
 
     def toggle_asset_visibility(self):
         """toggle asset visibility by type from current tab. if tab has no object, show hint"""
-        active_asset = []   # contain any visible asset to filter with search browser
-        no_asset = True # check if current tab has asset, if not show hint
-        all_asset = self.asset_container.get_all_item()
-        # print('all asset > ', all_asset)
+        model = self.asset_container.asset_model
         current_tab = self.browser.get_current_tab()
-        if current_tab != 'All':
-            for asset in all_asset: 
-                if asset.group == current_tab: 
-                    asset.show()
-                    active_asset.append(asset)
-                    no_asset = False
-                else: asset.hide()
+        search_text = self.search_field.text().lower()
+        previous, self.shown_filter = self.shown_filter, (model.revision, current_tab, search_text)
+        if previous and previous[0] == model.revision and previous[2] == search_text and previous[1] != current_tab and 'All' not in (previous[1], current_tab):
+            # only switched between two group tab, shown row of previous tab is hidden, row of current tab is shown, other group stay hidden
+            for asset in model.group_items(previous[1]):
+                if search_text in asset.name.lower(): self.asset_container.setRowHidden(model.row_of(asset), True)
+            for asset in model.group_items(current_tab):
+                if search_text in asset.name.lower(): self.asset_container.setRowHidden(model.row_of(asset), False)
         else:
-            active_asset = all_asset
-            for asset in all_asset: 
-                asset.show()
-                no_asset = False
-        self.hint = no_asset
-
-        # also check the search field if any asset needed to hide
-        for asset in active_asset: 
-            if self.search_field.text().lower() not in asset.name.lower(): asset.hide()
+            members = None if current_tab == 'All' else self.query_asset(group=current_tab)   # indexed group filter in sqlite mode
+            if members is not None: members = set(members)
+            for row, asset in enumerate(model.items):
+                visible = current_tab == 'All' or (asset in members if members is not None else asset.group == current_tab)
+                # also check the search field if any asset needed to hide
+                self.asset_container.setRowHidden(row, not (visible and search_text in asset.name.lower()))
+        self.hint = not model.group_items(current_tab)  # current tab has no asset
 
     def sort_asset(self, event=None):
         #if DEBUG: print ('sort asset')
-        all_asset = self.asset_container.get_all_item()
-        if event=='Name':
-            name_and_asset = [[asset.name, asset] for asset in all_asset]
-            sorted_asset = sorted([asset for asset in name_and_asset], key=lambda x: x[0].lower())
-            self.current_project.asset = [asset[1] for asset in sorted_asset]
-        if event=='Type':
-            type_and_asset = [[asset.type, asset] for asset in all_asset]
-            sorted_asset = sorted([asset for asset in type_and_asset], key = lambda x: x[0].lower())
-            self.current_project.asset = [asset[1] for asset in sorted_asset]
-        if event=='Last Updated':
-            date_and_asset = [[asset.date_modified, asset] for asset in all_asset]
-            sorted_asset = sorted([asset for asset in date_and_asset], key = lambda date_modified: datetime.strptime(date_modified[0], "%d/%m/%Y %H:%M"), reverse=True)
-            self.current_project.asset = [asset[1] for asset in sorted_asset]
-        if event=='Priority':
-            due_and_asset = [[asset.days_left, asset] for asset in all_asset]
-            sorted_asset = self.sort_priority(due_and_asset)
-            self.current_project.asset = [asset[1] for asset in sorted_asset]
-        if event==None:
-            #if DEBUG: print ('sort asset again with current text')
-            self.sort_asset(self.app.asset_sorter.currentText())
-            return
+        if event==None: event = self.app.asset_sorter.currentText()   # sort asset again with current text
+        key = self.sort_key(event)
+        if key is None: return
+        asset = self.query_asset(sorter=event) if event in STORE_SORT else None   # indexed sort in sqlite mode
+        if asset is None or len(asset) != len(self.asset_container.asset_model.items): asset = sorted(self.asset_container.get_all_item(), key=key)
+        self.current_project.asset = asset
         self.update_asset_order(self.current_project.asset)
 
+    def query_asset(self, group=None, sorter=None):
+        """asset of current project from database query, None if project isn't kept in database"""
+        uids = self.current_project.browser.query_asset(self.current_project, group, sorter)
+        if uids is None: return None
+        views = {asset.record.uid: asset for asset in self.asset_container.get_all_item()}
+        return [views[uid] for uid in uids if uid in views]
+
+    def sort_key(self, event):
+        """key of asset for sorter, record keep name, type and date key until it's changed"""
+        if event=='Name': return lambda asset: asset.record.sort_keys()[1]
+        if event=='Type': return lambda asset: asset.record.sort_keys()[2]
+        if event=='Last Updated': return lambda asset: -asset.record.sort_keys()[3]  # newest first
+        if event=='Priority': return EZMAssetItem.priority_key
+        return None
+
+    def reposition_asset(self, assets):
+        """move edited asset to its sorted place with bisect, other asset keep their row"""
+        key = self.sort_key(self.app.asset_sorter.currentText())
+        if key is None or not self.current_project: return
+        if len(assets) > REPOSITION_LIMIT: return self.sort_asset()
+        order = list(self.current_project.asset)
+        keys = [key(asset) for asset in order]  # bisect over key list, bisect key argument need python 3.10
+        for asset in dict.fromkeys(assets):
+            row = self.asset_container.asset_model.row_of(asset)
+            if row is None or order[row] is not asset: continue   # removed asset
+            value = keys[row] = key(asset)
+            if (row == 0 or keys[row-1] <= value) and (row == len(order)-1 or value <= keys[row+1]): continue   # still in place
+            del order[row]
+            del keys[row]
+            new_row = bisect_right(keys, value)
+            order.insert(new_row, asset)
+            keys.insert(new_row, value)
+            self.asset_container.move_item(asset, new_row)
+        self.current_project.asset = order
+
     def update_asset_order(self, asset):
-        for index in range(len(asset)):
-            self.asset_container.main_layout.insertWidget(index, asset[index])
-
-    def sort_priority(self, list):
-        due_list = []
-        past_list = []
-        completed_list = []
-        none_list = []
-        for item in list:
-            days_left = item[0]
-            if days_left == None: none_list.append(item)
-            elif item[1].status == 2: completed_list.append(item)
-            elif days_left >= 0: due_list.append(item)
-            elif days_left < 0: past_list.append(item)
-        due_list = sorted([asset for asset in due_list], key = lambda asset: asset[0])
-        past_list = sorted([asset for asset in past_list], key = lambda asset: asset[0])
-        completed_list = sorted([asset for asset in completed_list], key = lambda asset: asset[0],reverse=True)
-        return due_list + past_list + completed_list + none_list
+        self.asset_container.reorder_item(asset)
     
     def add_asset(self, files, group):
-        """only for adding new asset into project"""
+        """only for adding new asset into project, file and folder is scanned in background then added as one command"""
         if DEBUG: print('add asset')
-        # check for duplicate path, only accept unique path
-        duplicate_path = []
-        for file in files: 
-            duplicate_asset = self.check_duplicated_path(file)
-            if duplicate_asset: duplicate_path.append(duplicate_asset)
-        unique_files = [file for file in files if file not in duplicate_path]
-        self.hint = False  
-        self.current_project.execute(cmd_addAsset(self.current_project, self, unique_files, group))
+        if self.importer: self.importer.cancel()
+        self.importer = EZMAssetImport(self, self.current_project, group)
+        self.importer.start(files)
 
     def delete_asset(self):
         selection = self.asset_container.selected_item
@@ -314,6 +339,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         if fname != "" and self.check_if_type_compatible(fname, warning=True): 
             # check if there is asset with same path
             duplicate_asset = self.check_duplicated_path(fname, [selected_asset])
+            file_status.invalidate(fname)   # file could be created after its folder was listed
             if duplicate_asset==None:
                 self.current_project.execute(cmd_updateAsset(self, selected_asset, fname))
 
@@ -376,7 +402,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
                 shutil.copy2(file, asset.path)
 
         # update file version
-        old_item = EZMAssetVersion(asset, os.path.basename(old_file), old_file, asset.group, asset.date_modified, asset.type, asset.status)
+        old_item = VersionRecord(os.path.basename(old_file), old_file, asset.group, asset.record.date_modified, asset.type, asset.status)
         asset.add_version(old_item)
 
         # get date_modified, after everything done called onModified
@@ -385,8 +411,10 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
 
         asset.date_modified = date_modified
         asset.file = new_file
+        file_status.invalidate(asset.file)  # struct folder and .old folder changed on disk
+        file_status.invalidate(old_file)
         asset.eval()
-        self.onModified()
+        self.onModified([asset])
         
     def set_assignment_date(self):
         if self.asset_container.selected_item: 
@@ -406,7 +434,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
 
     def filter_imported_asset(self, files):
         """check if file is maya and decide what asset type"""
-        files = [file for file in files if self.check_if_type_compatible(file)]
+        files = [file for file in files if self.check_if_type_compatible(file) or os.path.isdir(file)]
         if files:
             if self.browser.get_current_tab() == 'All':
                 confirm = self.group_dialog.exec()    # set to modal and blocking flow till user confirm
@@ -420,19 +448,13 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         find any duplicate path from current project, exclude will ignore excluded asset
         this function acts as a warning to user, if found duplicate will return the not unique path (duplicate path)
         """
-        duplicate_path = None
-        duplicate_asset = None
-        for asset in self.current_project.asset:
-            if asset.path == path and asset not in exclude:
-                duplicate_path = path
-                duplicate_asset = asset
-                break
+        duplicate_name = self.current_project.browser.find_asset_path(self.current_project, path, [asset.record for asset in exclude])
 
-        if duplicate_path:
+        if duplicate_name is not None:
             QtWidgets.QMessageBox.warning(self, 
                                         'Duplicate path',
-                                        "Found asset with same path!\nasset name: %s\npath: %s"%(duplicate_asset.name, duplicate_asset.path))
-            return duplicate_path
+                                        "Found asset with same path!\nasset name: %s\npath: %s"%(duplicate_name, path))
+            return path
         else:
             return None
 
@@ -445,10 +467,8 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
             # warning = QtWidgets.QMessageBox.warning(self, 'Convert to struct', 'Converting asset to struct is undoable, do you wish to proceed?',QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
             # if warning == QtWidgets.QMessageBox.No: return
 
-            # convert to struct
+            # convert to struct, command swap asset and struct in container and project
             created_struct = []
-            self.asset_container.remove_item(unique_selected_item)
-            self.current_project.remove_asset(unique_selected_item)
             for asset in  unique_selected_item:
                 if os.path.exists(asset.path):
                     struct = EZMAssetStruct(asset.project, 
@@ -463,10 +483,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
                                     asset.date_assignment,
                                     asset.preview,
                                     asset.notes)
-                created_struct.append(struct)
-                self.asset_container.add_item(struct)
-                self.current_project.add_asset(struct)
-                self.asset_container.modify_selection(struct, add=True)
+                    created_struct.append(struct)
             self.current_project.execute(cmd_convertToStruct(self.current_project, self, unique_selected_item, created_struct))
 
     def create_asset_placeholder(self):
@@ -494,7 +511,7 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
             self.setStyleSheet('background-color:#2E2E2E')
             files = [u.toLocalFile() for u in event.mimeData().urls()]
             for name in files: 
-                if self.check_if_type_compatible(name): 
+                if self.check_if_type_compatible(name) or os.path.isdir(name):   # folder is scanned for compatible file
                     event.accept()
                     break
         else:
@@ -531,9 +548,96 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
         if warning: QtWidgets.QMessageBox.warning(self, 'Operation denied', 'File type not supported!')
         return False
 
-    def refresh(self):
-        for asset in self.asset_container.get_all_item():
+    def refresh(self, reload=True):
+        """evaluate every asset, reload read the folders again on worker thread, otherwise listing cached by file_status is used"""
+        if reload:
+            file_status.invalidate()
+            self.validate_asset(self.asset_container.get_all_item())
+        elif not self.path_validator.is_running(): # running validation eval every asset when its folder is read
+            self.eval_asset(self.asset_container.get_all_item())
+
+    def eval_asset(self, assets):
+        """path is checked through file_status, so directory holding several asset is listed once"""
+        for asset in assets: asset.eval()
+
+    def validate_asset(self, assets):
+        """read folders on worker thread, asset is painted as unknown until its folder is read. replace validation of previous project"""
+        for asset in assets: asset.reset_eval()
+        self.path_validator.validate(list(assets), lambda asset: asset.eval_paths(), self.asset_validated)
+
+    def asset_validated(self, assets):
+        for asset in assets:
+            if asset.container is self.asset_container: asset.eval()  # removed or from previous project is skipped
+
+    def watch_asset(self):
+        """watch folder of every asset, struct file and .old version of current project"""
+        self.watched_asset = {}
+        self.watched_folder = {}
+        self.asset_folders = {}
+        self.rewatch_asset = {}
+        self.watch_revision = self.asset_container.asset_model.revision
+        for asset in self.asset_container.get_all_item(): self.add_watch(asset)
+        self.folder_watcher.watch(list(self.watched_folder.values()))
+
+    def update_watch(self):
+        """watch folder of asset added, removed or moved since last update, watcher is only told when watched folder changed"""
+        model = self.asset_container.asset_model
+        changed, self.rewatch_asset = self.rewatch_asset, {}
+        if model.revision != self.watch_revision:   # row added or removed
+            self.watch_revision = model.revision
+            for asset in [asset for asset in self.asset_folders if asset.container is not self.asset_container]: changed[asset] = True
+            for asset in model.items:
+                if asset not in self.asset_folders: changed[asset] = True
+        folder_changed = False
+        for asset in changed:
+            folder_changed |= self.remove_watch(asset)
+            if asset.container is self.asset_container: folder_changed |= self.add_watch(asset)
+        if folder_changed: self.folder_watcher.watch(list(self.watched_folder.values()))
+
+    def path_changed(self, asset):
+        """path, file or version of asset changed, its folder is watched again on next update"""
+        self.rewatch_asset[asset] = True
+
+    def add_watch(self, asset):
+        """return True if a folder is watched for the first time"""
+        added = False
+        keys = self.asset_folders[asset] = []
+        for path in asset.eval_paths():
+            folder = os.path.dirname(os.path.normpath(path))
+            key = os.path.normcase(folder)
+            if key in keys: continue
+            keys.append(key)
+            if key not in self.watched_asset:
+                self.watched_asset[key] = {}
+                self.watched_folder[key] = folder
+                added = True
+            self.watched_asset[key][asset] = True
+        return added
+
+    def remove_watch(self, asset):
+        """return True if a folder is no longer watched"""
+        removed = False
+        for key in self.asset_folders.pop(asset, []):
+            assets = self.watched_asset[key]
+            assets.pop(asset, None)
+            if not assets:
+                del self.watched_asset[key]
+                del self.watched_folder[key]
+                removed = True
+        return removed
+
+    def folders_changed(self, folders):
+        """only asset inside changed folder is evaluated again, date modified follow file written outside the app"""
+        changed = {}    # asset in folder order, without duplicate
+        for folder in folders:
+            file_status.invalidate(folder)
+            for asset in self.watched_asset.get(os.path.normcase(os.path.normpath(folder)), []): changed[asset] = True
+        modified = []
+        for asset in changed:
+            if asset.container is not self.asset_container: continue
             asset.eval()
+            if asset.sync_date_modified(): modified.append(asset)
+        if modified: self.onModified(modified)  # save new date
     
     def contextMenuEvent(self, event):
         if self.asset_container.selected_item:
@@ -621,88 +725,239 @@ class EZMAssetScroll(QtWidgets.QScrollArea):
             elif res == refreshStruct:
                 self.refresh()
 
-class EZMAssetItem(custom_widget.InteractiveItem):
+class EZMAssetImport(QtCore.QObject):
+    """
+    bulk import of dropped file and folder: stat on worker threads, check duplicate path in one pass and create asset in batches.
+    everything imported is added by one undoable command, cancel leave project unchanged
+    """
+    def __init__(self, asset_scroll, project, group):
+        super().__init__(asset_scroll)
+        self.asset_scroll = asset_scroll
+        self.project = project
+        self.group = group
+
+        self.queue = [] # (path, date_modified) to create
+        self.created = []
+        self.duplicates = []    # (asset name, path)
+        self.names = set(asset.name for asset in self.project.asset)
+
+        self.progress = QtWidgets.QProgressDialog('Scanning files...', 'Cancel', 0, 0, asset_scroll)
+        self.progress.setWindowTitle('Import file')
+        self.progress.setWindowModality(QtCore.Qt.WindowModal)
+        self.progress.setMinimumDuration(500)   # small import is done before dialog shows
+        self.progress.canceled.connect(self.cancel)
+
+    def start(self, files):
+        self.asset_scroll.file_scanner.scan(files, COMPATIBLE_FILE, self.scanned)
+
+    def scanned(self, found):
+        """skip path already in project or dropped twice, checked against project path index"""
+        index = self.project.record.path_index()
+        dropped = {}    # path_key : file name of path already queued
+        for path, date_modified in found:
+            key = path_key(path)
+            if key in index: self.duplicates.append((index[key][0].name, path))
+            elif key in dropped: self.duplicates.append((dropped[key], path))
+            else:
+                dropped[key] = os.path.splitext(os.path.basename(path))[0]
+                self.queue.append((path, date_modified))
+        self.progress.setLabelText('Importing files...')
+        self.progress.setRange(0, len(self.queue))
+        self.create_batch()
+
+    def create_batch(self):
+        if self.asset_scroll.importer is not self: return   # canceled
+        for path, date_modified in self.queue[len(self.created):len(self.created)+IMPORT_BATCH]:
+            name = check_duplicate_str(os.path.splitext(os.path.basename(path))[0], self.names)
+            self.names.add(name)
+            file_type = os.path.splitext(path)[1].lower()[1:]
+            self.created.append(EZMAssetItem(self.project, self.asset_scroll, name, path, self.group, date_modified, file_type, 0))
+        self.progress.setValue(len(self.created))
+        if len(self.created) < len(self.queue): QtCore.QTimer.singleShot(0, self.create_batch)  # let progress and cancel button repaint
+        else: self.finish()
+
+    def finish(self):
+        self.close()
+        for path, date_modified in self.queue: file_status.invalidate(path)    # dropped file could be newer than cached folder listing
+        if self.created:
+            self.asset_scroll.hint = False
+            self.project.execute(cmd_addAsset(self.project, self.asset_scroll, self.created))
+        if self.duplicates:
+            listed = '\n'.join('%s: %s'%(name, path) for name, path in self.duplicates[:DUPLICATE_LISTED])
+            if len(self.duplicates) > DUPLICATE_LISTED: listed += '\n... and %s more'%(len(self.duplicates)-DUPLICATE_LISTED)
+            QtWidgets.QMessageBox.warning(self.asset_scroll,
+                                        'Duplicate path',
+                                        "Skipped %s file already in project!\n\n%s"%(len(self.duplicates), listed))
+
+    def cancel(self):
+        self.asset_scroll.file_scanner.cancel()
+        self.close()
+
+    def close(self):
+        if self.asset_scroll.importer is self: self.asset_scroll.importer = None
+        self.progress.canceled.disconnect(self.cancel)
+        self.progress.reset()
+        self.progress.deleteLater()
+        self.deleteLater()
+
+class EZMAssetItem(object):
+    """
+    view over AssetRecord, shown as one row in EZMAssetListView and painted by EZMAssetDelegate.
+    no widget is created per asset so project with thousands of asset open as fast as the visible row
+    """
+    preview = record_property('preview')
+    notes = record_property('notes')
+
     def __init__(self, project, asset_scroll, name, path, group, date_modified, type, status, date_assignment=[], preview='',notes=''):
-        """ status { 0:checked ; 1:checked ; 2:verified }"""
-        
+        """ status { 0:unchecked ; 1:checked ; 2:verified }"""
+        self.initView(project, asset_scroll, AssetRecord(name, path, group, date_modified, type, status, date_assignment, preview, notes))
+
+    @classmethod
+    def from_record(cls, project, asset_scroll, record):
+        asset = cls.__new__(cls)
+        asset.initView(project, asset_scroll, record)
+        return asset
+
+    def initView(self, project, asset_scroll, record):
         self.project = project
         self.asset_scroll = asset_scroll
-        self.name = name
-        self.path = path
-        self.group = group
-        self.date_modified = date_modified
-        self._type = type
-        self._status = status  # assigned in eval when open asset
-        self.preview = preview
-        self.notes = notes
+        self.record = record
 
+        self.container = None   # list view holding this asset, None if removed from container
+        self._selected = False
+        self.valid = True   # result of path check, updated in eval. None while checked in background
         self.days_left = None
 
-        super().__init__() # it automatically call initUI and init container
-        self.date_assignment = date_assignment  # contains 2 item in list [start date, due date] (called after init ui)
+        self.update_deadline_UI()
         self.loadAssignment()   # if asset contains assignment date, initialize to calendar editor (init last as everything is done)
 
     @staticmethod
     def verify_file_integrity(asset):
         asset.eval()    # update ui
-        if os.path.exists(asset.path): return True
-        else: return False
+        return file_status.exists(asset.path)
+
+    @property
+    def name(self):
+        return self.record.name
+    
+    @name.setter
+    def name(self, name):
+        self.record.name = name
+        self.record.touch()
+        self.update()
+
+    @property
+    def path(self):
+        return self.record.path
+
+    @path.setter
+    def path(self, path):
+        with self.path_change():
+            self.record.path = path
+            self.record.touch()
+
+    @contextmanager
+    def path_change(self):
+        """keep project path index and watched folder pointing at this asset while its path, file or version change"""
+        indexed = self.project.record.unindex_asset(self.record)    # removed asset is not indexed again
+        try:
+            yield
+        finally:
+            if indexed: self.project.record.index_asset(self.record)
+            if self.container: self.asset_scroll.path_changed(self)
+
+    @property
+    def date_modified(self):
+        return format_date(self.record.date_modified)
+    
+    @date_modified.setter
+    def date_modified(self, date):
+        self.record.date_modified = parse_date(date)
+        self.record.touch()
+
+    @property
+    def group(self):
+        return self.record.group
+
+    @group.setter
+    def group(self, group):
+        old_group = self.record.group
+        self.record.group = group
+        self.record.touch()
+        # move to its new group bucket, or tab switch would still show it under the old group
+        if self.container and old_group != group: self.container.asset_model.regroup(self, old_group)
 
     @property
     def type(self):
-        return self._type
+        return self.record.type
     
     @type.setter
     def type(self, type):
-        self._type = type
-        self.reassign_file_icon()
+        self.record.type = type
+        self.record.touch()
+        self.update()
 
     @property
     def status(self):
-        return self._status
+        return self.record.status
     
     @status.setter
     def status(self, status):
-        self._status = status
-        if status == 0:
-            self.version_lbl.change_icon(get_path('unchecked.png', icon=True))
-        elif status == 1:
-            self.version_lbl.change_icon(get_path('checked.png', icon=True))
-        elif status == 2:
-            self.version_lbl.change_icon(get_path('verified.png', icon=True))
+        self.record.status = status
+        self.record.touch()
         self.update_deadline_UI()
 
     @property
     def date_assignment(self):
-        return self._date_assignment
+        return self.record.date_assignment
     
     @date_assignment.setter
     def date_assignment(self, date):
-        self._date_assignment = date
+        self.record.date_assignment = date
+        self.record.touch()
         if not date: self.days_left = None # if assignment is removed
         self.update_deadline_UI()
 
-    def initUI(self):
-        self.main_layout = QtWidgets.QVBoxLayout(self)
-        self.item_layout = QtWidgets.QHBoxLayout()
-
-        self.version_lbl = custom_widget.GraphicLabel(get_path('unchecked.png', icon=True), (24,24))
-        self.icon_lbl = custom_widget.ValidableGraphicLabel(get_path('file_%s.png'%self.type, icon=True), (28,28))
-        self.name_lbl = custom_widget.NameableLabel(self.name, 99)
-        self.name_lbl.renameEvent = self.renameEvent    # override virtual function event
-        self.remaining_time_lbl = QtWidgets.QLabel('3 days')
-        self.deadline_btn = custom_widget.GraphicButton(get_path('timer.png', icon=True),self.go_to_assignment,QtGui.QColor("orange"),1,(16,16))
-        self.path_btn = custom_widget.GraphicButton(get_path("external_link.png",icon=True),self.go_to_path,QtGui.QColor("white"),0.7,(16,16))
-
-        self.item_layout.addWidget(self.version_lbl)
-        self.item_layout.addWidget(self.icon_lbl)
-        self.item_layout.addWidget(self.name_lbl)
-        self.item_layout.addStretch()
-        self.item_layout.addWidget(self.remaining_time_lbl)
-        self.item_layout.addWidget(self.deadline_btn)
-        self.item_layout.addWidget(self.path_btn)
-
-        self.main_layout.addLayout(self.item_layout)
+    @property
+    def selected(self):
+        return self._selected
+    
+    @selected.setter
+    def selected(self, select):
+        if self.container:
+            self._selected = select
+            self.update()
+            if select: self.selectEvent(self.container.selected_item)
+
+    def update(self):
+        """repaint the row of this asset, it's cheap and do nothing if asset not in container"""
+        if self.container: self.container.update_item(self)
+
+    def get_icon(self):
+        return 'file_%s.png'%self.type
+
+    def get_status_icon(self):
+        if self.valid is False: return 'warning.png'
+        return ['unchecked.png', 'checked.png', 'verified.png'][self.status]
+
+    def get_tooltip(self):
+        if self.valid is None: return 'checking path...'
+        if not self.valid: return 'path not found'
+        return None
+
+    def priority_key(self):
+        """due soonest first, then overdue, completed (latest due first) and asset without assignment last"""
+        if self.days_left is None: return (3, 0)
+        if self.status == 2: return (2, -self.days_left)
+        if self.days_left >= 0: return (0, self.days_left)
+        return (1, self.days_left)
+
+    def get_deadline_color(self):
+        if self.days_left > 14: return 'DeepSkyBlue'
+        elif 7 < self.days_left <= 14: return 'yellow'
+        elif 2 < self.days_left <= 7: return 'orange'
+        elif 0 <= self.days_left <= 2: return 'tomato'
+        return 'grey'
 
     def get_date_key_calendar(self):
         """one way to check if asset is assigned with deadline"""
@@ -735,14 +990,16 @@ class EZMAssetItem(custom_widget.InteractiveItem):
 
     def loadAssignment(self):
         """update data inside this class to checklist class. act as a super function to handle multiple condition (might not be the best)"""
+        date_key = self.get_date_key_calendar()  # scan calendar once, key only change when moved below
         # if assignment date,status,name changed (update ui in calendar editor)
-        if self.get_date_key_calendar():
+        if date_key:
             # when date doesnt match
-            if self.date_assignment and self.get_date_key_calendar() != self.date_assignment[1]:
+            if self.date_assignment and date_key != self.date_assignment[1]:
                 self.remove_asset_assignment_from_calendar()
                 self.get_calendar_editor().add_asset(self.date_assignment[1], self)
+                date_key = self.date_assignment[1]
             if self.is_assignment_visible():
-                date_widget = self.get_calendar_editor().date_obj[self.get_date_key_calendar()]
+                date_widget = self.get_calendar_editor().date_obj[date_key]
                 assignment_box = date_widget.active_assignment[self]
                 # when status doesnt match
                 if (assignment_box.isChecked and self.status != 2) or (not assignment_box.isChecked and self.status ==2):
@@ -755,29 +1012,25 @@ class EZMAssetItem(custom_widget.InteractiveItem):
             self.get_calendar_editor().update_calendar() # refresh calendar widget (current month only)
 
         # if asset has assignment but not registered to calendar yet
-        if not self.get_date_key_calendar() and len(self.date_assignment)==2:
+        if not date_key and len(self.date_assignment)==2:
             self.get_calendar_editor().add_asset(self.date_assignment[1], self)
             return
         # check if asset is deleted
-        if self.container == None and self.get_date_key_calendar():
+        if self.container == None and date_key:
             self.remove_asset_assignment_from_calendar()
             return
            
-    def reassign_file_icon(self):
-        """decide which asset icon to display, assume all sources image has valid path name"""
-        self.icon_lbl.change_icon(get_path('file_%s.png'%self.type, icon=True))
-
-    def go_to_assignment(self, event):
+    def go_to_assignment(self, event=None):
         self.asset_scroll.app.calendar_dock.show()
         date = QtCore.QDate.fromString(self.date_assignment[1],'dd/MM/yyyy')
         self.get_calendar_editor().load_calendar(date.year(),date.month())
         self.get_calendar_editor().select_by_datekey(self.date_assignment[1])
 
-    def go_to_path(self, event):
+    def go_to_path(self, event=None):
         self.asset_scroll.refresh() # update all asset ui
         if os.path.exists(self.path):
             self.process = subprocess.Popen('explorer /select,%s'%os.path.normpath(self.path))
-        else: warning_path_not_exist(self, self.path)
+        else: warning_path_not_exist(self.asset_scroll, self.path)
 
     def renameEvent(self, text):
         self.project.execute(cmd_renameAsset(self, text))
@@ -789,10 +1042,11 @@ class EZMAssetItem(custom_widget.InteractiveItem):
         """select and highlight the asset and also open the asset detail"""
         self.asset_scroll.manager.update_asset_detail([self])
         self.asset_scroll.manager.asset_detail.content_visible = True
-        self.container.reset_selection([self])
+        if self.container:
+            self.container.reset_selection([self])
+            self.container.scroll_to_item(self)
 
     def mousePressEvent(self, event):
-        super().mousePressEvent(event)
         if DEBUG: print("selected > ", [item.name for item in self.container.selected_item])
         self.asset_scroll.app.main_window.statusBar().showMessage("Selected: %s   Total Asset: %s"%(len(self.container.selected_item) , len(self.project.asset)))
 
@@ -801,156 +1055,92 @@ class EZMAssetItem(custom_widget.InteractiveItem):
         self.asset_scroll.manager.asset_detail.content_visible = not self.asset_scroll.manager.asset_detail.content_visible
 
     def eval(self):
-        """this function help to take care of all ui stuff only, display warning when invalid - vice versa"""
+        """check the path and repaint the row, display warning when invalid - vice versa"""
         if self.type == '.object': return   # ignore placeholder
-        if not os.path.exists(self.path):
-            self.version_lbl.change_icon(get_path('warning.png', icon=True))
-            self.version_lbl.setToolTip('path not found')
-            self.name_lbl.label.setStyleSheet('color: #FF6E70')
-        else: 
-            self.status = self.status # retrieve normal status icon display
-            self.version_lbl.setToolTip(None)
-            self.name_lbl.label.setStyleSheet('color: white')
+        self.valid = file_status.exists(self.path)
+        self.update()
+
+    def sync_date_modified(self):
+        """follow modified time of file written outside the app, return True if changed"""
+        if not self.valid: return False
+        mtime = file_status.mtime(self.path)
+        if mtime is None or timestamp_date(mtime) == self.record.date_modified: return False
+        self.date_modified = timestamp_date(mtime)
+        return True
+
+    def eval_paths(self):
+        """path checked by eval, read in background by asset scroll"""
+        if self.type == '.object': return []
+        return [self.path]
+
+    def reset_eval(self):
+        """path is not checked yet, painted as unknown until next eval"""
+        if self.type != '.object': self.valid = None
 
     def update_deadline_UI(self):
         if self.date_assignment and self.status != 2:
-            self.deadline_btn.show()
-            self.remaining_time_lbl.show()
             self.days_left = QtCore.QDateTime.currentDateTime().daysTo(QtCore.QDateTime.fromString(self.date_assignment[1],'dd/MM/yyyy'))
-            if self.days_left > 14:
-                self.remaining_time_lbl.setStyleSheet('color:DeepSkyBlue')
-            elif 7 < self.days_left <= 14:
-                self.remaining_time_lbl.setStyleSheet('color:yellow')
-            elif 2 < self.days_left <= 7:
-                self.remaining_time_lbl.setStyleSheet('color:orange')
-            elif 0 <= self.days_left <= 2:
-                self.remaining_time_lbl.setStyleSheet('color:tomato')
-            else:
-                self.remaining_time_lbl.setStyleSheet('color:grey')
-            self.remaining_time_lbl.setText('%s days'%self.days_left)
-        elif self.date_assignment and self.status == 2:
-            self.remaining_time_lbl.hide()
-            self.deadline_btn.show()
-        else:
-            self.remaining_time_lbl.hide()
-            self.deadline_btn.hide()
+        self.update()   # remaining time and deadline button are painted by delegate
 
     def serialize(self):
-        asset_dict =  OrderedDict([('name', self.name),
-                                   ('path', self.path),
-                                   ('group', self.group),
-                                   ('date_modified', self.date_modified),
-                                   ('type', self.type),
-                                   ('status', self.status),
-                                   ('date_assignment', self.date_assignment),
-                                   ('preview', self.preview),
-                                   ('notes', self.notes)])
-        return asset_dict
+        return self.record.to_dict()
 
 class EZMAssetStruct(EZMAssetItem):
     def __init__(self, project, asset_scroll, name, path, group, date_modified, type, status, file, date_assignment=[], preview='', notes=''):
-        self._file = file
-        super().__init__(project, asset_scroll, name, path, group, date_modified, type, status, date_assignment, preview, notes) 
-        self.reassign_file_icon()   # cheating way to update file icon, might need to cleaner way
+        self.initView(project, asset_scroll, StructRecord(name, path, group, date_modified, type, status, file, date_assignment, preview, notes))
 
+    def initView(self, project, asset_scroll, record):
         self.collapsed = True
-        self.file_version = []  # contain other version of this struct
-
-        #self.initFolder()
+        self.file_valid = True
+        self.detail_widget = None   # only built when user expand the struct
+        super().initView(project, asset_scroll, record)
+        self.deserialize()
 
     @property
     def file(self):
-        return self._file
+        return self.record.file
     
     @file.setter
     def file(self, file):
-        self._file = file
-        basename = os.path.basename(self._file)
-        self.file_lbl.setText(basename)
-        self.reassign_file_icon()
-
-    def reassign_file_icon(self):
-        self.file_icon.change_icon(get_path('file_%s.png'%os.path.splitext(self.file)[1].lower()[1:], icon=True))
-
-    # def initFolder(self):
-    #     """Guard to check folder, everytime object is created or load"""
-    #     if os.path.exists(self.project.path) and not os.path.exists(self.path):
-    #         if DEBUG: print('init folder struct for %s, folder path: %s'%(self.name, self.path))
-    #         os.makedirs(self.path)
-    #     else:
-    #         if DEBUG: print('(Struct) %s > cancelled build, folder with same path might be existed'%self.name)
+        with self.path_change():
+            self.record.file = file
+            self.record.touch()
+        if self.detail_widget: self.detail_widget.update_file()
+        self.update()
 
-    def initUI(self):
-        super().initUI()
-        self.detail_widget = QtWidgets.QFrame()
-        self.detail_widget.setObjectName('struct_detail')
-        self.detail_widget.setContentsMargins(20,0,0,0)
-        self.detail_widget.setStyleSheet('QFrame#struct_detail{border: 1px solid #505050}') #1363bf > blue
-        self.detail_layout = QtWidgets.QVBoxLayout(self.detail_widget)
-        self.file_layout = QtWidgets.QHBoxLayout()
-        self.old_ver_layout = QtWidgets.QVBoxLayout()
-
-        # struct additional widget
-        self.icon_lbl.change_icon(get_path('file_struct.png', icon=True))
-        self.detail_icon = custom_widget.GraphicButton(get_path('expand.png', icon=True),
-                                                       self.toggle_detail, 
-                                                       color=QtGui.QColor('white'), 
-                                                       strength=1,
-                                                       size=(12,12))
-
-        #self.warning_icon = custom_widget.GraphicLabel(get_path('warning.png', icon=True), (20,20))
-        self.file_icon = custom_widget.ValidableGraphicLabel(get_path('file_%s.png'%self.type, icon=True), (24,24))
-        self.file_lbl = custom_widget.LimitedLabel(os.path.basename(self.file), 99)
-
-        # old version widget configuration
-        self.old_file_widget = custom_widget.ExpandableWidget()
-        self.folder_icon = custom_widget.GraphicLabel(get_path('folder.png', icon=True), (20,20))
-        self.other_ver_lbl = QtWidgets.QLabel('version [0 items]')
-
-        self.old_file_widget.header_layout.insertWidget(0, self.folder_icon)
-        self.old_file_widget.header_layout.insertWidget(1, self.other_ver_lbl)
-        self.old_file_widget.header_layout.addStretch()
-
-        # self.option_icon = custom_widget.GraphicButton(get_path('option.png', icon=True), 
-        #                                                color=QtGui.QColor('white'), 
-        #                                                strength=1,
-        #                                                size=(16,16))
-        # self.item_layout.insertWidget(5, self.option_icon)
-
-        self.item_layout.insertWidget(2, self.detail_icon)
-
-        #self.file_layout.addWidget(self.warning_icon)
-        self.file_layout.addWidget(self.file_icon)
-        self.file_layout.addWidget(self.file_lbl)
-
-        self.old_ver_layout.addWidget(self.old_file_widget)
-
-        self.detail_layout.addLayout(self.file_layout)
-        self.detail_layout.addLayout(self.old_ver_layout)
-
-        self.main_layout.addLayout(self.item_layout)
-        self.main_layout.addWidget(self.detail_widget)
-        
-        self.detail_widget.hide()
-
-    def add_version(self, item):
-        self.filter_duplicate(item)
-        self.file_version.append(item)
-        self.old_file_widget.add_item(item)
-        self.other_ver_lbl.setText('version [%s items]'%len(self.file_version))
-
-    def remove_version(self, item):
-        self.file_version.remove(item)
+    @property
+    def file_version(self):
+        """VersionRecord of older file, row widget only exist inside detail widget once struct is expanded"""
+        return self.record.file_version
+
+    def get_icon(self):
+        return 'file_struct.png'
+
+    def get_file_icon(self):
+        return 'file_%s.png'%os.path.splitext(self.file)[1].lower()[1:]
+
+    def add_version(self, version):
+        with self.path_change():
+            self.filter_duplicate(version)
+            self.record.file_version.append(version)
+            self.record.touch()
+        if self.detail_widget: self.detail_widget.add_version(version)
+
+    def remove_version(self, version):
+        with self.path_change():
+            self.record.file_version.remove(version)
+            self.record.touch()
         self.asset_scroll.onModified()
-        self.other_ver_lbl.setText('version [%s items]'%len(self.file_version))
+        if self.detail_widget: self.detail_widget.remove_version(version)
 
-    def filter_duplicate(self, item):
+    def filter_duplicate(self, version):
         """check if any duplicate version available, if present will always delete older one"""
-        for version in self.file_version: # bug prevent from duplicate path old version
-            if os.path.normpath(version.path) == os.path.normpath(item.path):
-                self.file_version.remove(version)
-                version.setParent(None)
-                version.deleteLater()
+        for old in self.file_version: # bug prevent from duplicate path old version
+            if os.path.normpath(old.path) == os.path.normpath(version.path):
+                self.record.file_version.remove(old)
+                self.record.touch()
+                if self.detail_widget: self.detail_widget.remove_version(old)
+                break
 
     # def renameEvent(self, text):
     #     # this will called if text not empty or same as previous text
@@ -978,83 +1168,72 @@ class EZMAssetStruct(EZMAssetItem):
         
     #     return unique_path, unique_name
 
-    def go_to_path(self, event):
+    def go_to_path(self, event=None):
         self.asset_scroll.refresh() # update all asset ui
         if os.path.exists(self.path):
             os.startfile(self.path)
-        else: warning_path_not_exist(self, self.path)
+        else: warning_path_not_exist(self.asset_scroll, self.path)
 
-    def toggle_detail(self, event):
+    def toggle_detail(self, event=None):
         if self.collapsed:
-            self.detail_widget.show()
-            self.detail_icon.change_icon(get_path('collapse.png', icon=True))
+            if not self.detail_widget: self.detail_widget = EZMAssetStructDetail(self)
             self.collapsed = False
         else:
-            self.detail_widget.hide()
-            self.detail_icon.change_icon(get_path('expand.png', icon=True))
             self.collapsed = True
+        if self.container: self.container.toggle_item_widget(self, self.detail_widget)
+
+    def eval_paths(self):
+        return super().eval_paths() + [self.file] + [version.path for version in self.file_version]
+
+    def sync_date_modified(self):
+        """struct keep its publish date, only newer write of its file outside the app move it"""
+        if not self.file_valid: return False
+        mtime = file_status.mtime(self.file)
+        if mtime is None or timestamp_date(mtime) <= self.record.date_modified: return False
+        self.date_modified = timestamp_date(mtime)
+        return True
+
+    def reset_eval(self):
+        super().reset_eval()
+        self.file_valid = None
 
     def eval(self):
         super().eval()
         # evaluation for file
-        if os.path.exists(self.file): 
-            #self.warning_icon.hide()
-            self.icon_lbl.set_valid(True)
-            self.file_icon.set_valid(True)
-            self.file_icon.setToolTip(None)
-            self.file_lbl.setStyleSheet('color: white')
-        else: 
-            #self.warning_icon.show()
-            self.icon_lbl.set_valid(False)
-            self.file_icon.set_valid(False)
-            self.file_icon.setToolTip('file missing')
-            self.file_lbl.setStyleSheet('color: #FF6E70')
-        # evaluation for older file version
-        for version in self.file_version: version.eval()
-
-    def serialize(self):
-        all_version = []
-        for version in self.file_version:
-            all_version.append(version.serialize())
-
-        asset_dict =  OrderedDict([('name', self.name),
-                                   ('path', self.path),
-                                   ('group', self.group),
-                                   ('date_modified', self.date_modified),
-                                   ('type', self.type),
-                                   ('status', self.status),
-                                   ('file', self.file),
-                                   ('date_assignment', self.date_assignment),
-                                   ('preview', self.preview),
-                                   ('file_version', all_version),
-                                   ('notes', self.notes)])
-        return asset_dict
-    
-    def deserialize(self, file_version=[]):
-        try:
-            for data in file_version:
-                version = EZMAssetVersion(self, data['name'], data['path'], data['group'], data['date_modified'], data['type'], data['status'])
-                self.add_version(version)
-        except Exception as e: print(e)
+        self.file_valid = file_status.exists(self.file)
+        if self.detail_widget: self.detail_widget.eval()    # also evaluate older file version row
+        self.update()
+
+    def deserialize(self):
+        """drop duplicated version path like add_version does, version stay as record until struct is expanded"""
+        versions = {}
+        for version in self.record.file_version: versions[os.path.normpath(version.path)] = version  # later one win, same as adding them in order
+        if len(versions) != len(self.record.file_version):
+            self.record.file_version = [version for version in self.record.file_version if versions[os.path.normpath(version.path)] is version]
+            self.record.touch()
 
 class EZMAssetVersion(QtWidgets.QFrame):
-    """it's similar to how you treat EZMAssetItem without interactive and additional properties"""
-    def __init__(self, struct, name, path, group, date_modified, type, status):
+    """it's similar to how you treat EZMAssetItem without interactive and additional properties, view over VersionRecord"""
+    name = record_property('name')
+    path = record_property('path')
+    group = record_property('group')
+    type = record_property('type')
+    status = record_property('status')
+
+    def __init__(self, struct, record):
         super().__init__()
         self.struct = struct
-        self.name = name
-        self.path = path
-        self.group = group
-        self.date_modified = date_modified
-        self.type = type
-        self.status = status
+        self.record = record
 
         self.initUI()
 
+    @property
+    def date_modified(self):
+        return format_date(self.record.date_modified)
+
     def initUI(self):
         self.setMaximumHeight(30)
-        self.setObjectName('assetVersion')
-        self.setStyleSheet('QFrame#assetVersion{border: 1px solid #505050}')
+        self.setObjectName('assetVersion')  # border follow 'missing' property, see dark.qss
 
         self.main_layout = QtWidgets.QHBoxLayout(self)
         self.main_layout.setContentsMargins(3,3,3,3)
@@ -1080,38 +1259,536 @@ class EZMAssetVersion(QtWidgets.QFrame):
     def switch_version(self, event):
         if os.path.exists(self.path):
             if self.struct.asset_scroll.check_before_publish(self.path, self.struct):   # check if all goes well
-                if self.struct.asset_scroll.update_struct(self.struct, self.path, version_suffix=False) == False: return # check if user not cancelled (if current file exist in older ver)
-                self.struct.remove_version(self)
-                self.setParent(None)
-                self.deleteLater()
-                if os.path.exists(self.path): send2trash(self.path.replace("/", "\\"))  # safe version: cuz it's copy and delete the older version
-                self.struct.asset_scroll.onModified()
+                with self.struct.asset_scroll.batch():  # publish and version removal both call onModified, run it once after both
+                    if self.struct.asset_scroll.update_struct(self.struct, self.path, version_suffix=False) == False: return # check if user not cancelled (if current file exist in older ver)
+                    self.struct.remove_version(self.record)    # detail widget remove this row
+                    if os.path.exists(self.path): send2trash(self.path.replace("/", "\\"))  # safe version: cuz it's copy and delete the older version
+                    file_status.invalidate(self.path)
         else: print("can't switch version, file is not found!")
 
     def onDelete(self, event):
-        self.struct.remove_version(self)
-        self.setParent(None)
-        self.deleteLater()
+        self.struct.remove_version(self.record)    # detail widget remove this row
         if os.path.exists(self.path): send2trash(self.path.replace("/", "\\"))  # safe version: it's intuitive and clear
+        file_status.invalidate(self.path)   # listing is kept until invalidated, don't wait for the watcher
 
     def eval(self):
-        if os.path.exists(self.path):
-            self.setStyleSheet('QFrame#assetVersion{border: 1px solid #505050}')
+        if file_status.exists(self.path):
+            set_style_property(self, 'missing', False)
             self.warning_lbl.hide()
             self.warning_lbl.setToolTip(None)
         else:
-            self.setStyleSheet('QFrame#assetVersion{border: 1px solid crimson}')
+            set_style_property(self, 'missing', True)
             self.warning_lbl.show()
             self.warning_lbl.setToolTip('file not found')
 
     def serialize(self):
-        version_dict =  OrderedDict([('name', self.name),
-                                    ('path', self.path),
-                                    ('group', self.group),
-                                    ('date_modified', self.date_modified),
-                                    ('type', self.type),
-                                    ('status', self.status)])
-        return version_dict
+        return self.record.to_dict()
+
+class EZMAssetListModel(QtCore.QAbstractListModel):
+    """keep asset item for EZMAssetListView, only hold reference so row cost nothing until it's painted"""
+    ItemRole = QtCore.Qt.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.items = []
+        self._rows = None   # cache {item: row}, rebuilt when order changed
+        self.groups = {}    # group : {item: True}, tab only show or hide its own group
+        self.revision = 0   # increased when row is added, removed or change group
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.isValid(): return 0
+        return len(self.items)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid(): return None
+        item = self.items[index.row()]
+        if role == self.ItemRole: return item
+        elif role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole): return item.name
+        elif role == QtCore.Qt.ToolTipRole: return item.get_tooltip()
+        return None
+
+    def flags(self, index):
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable
+
+    def row_of(self, item):
+        if self._rows is None: self._rows = {item: row for row, item in enumerate(self.items)}
+        return self._rows.get(item)
+
+    def index_of(self, item):
+        row = self.row_of(item)
+        if row is None: return QtCore.QModelIndex()
+        return self.index(row)
+
+    def group_items(self, group):
+        if group == 'All': return self.items
+        return list(self.groups.get(group, ()))
+
+    def append_items(self, items):
+        if not items: return
+        first = len(self.items)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first+len(items)-1)
+        self.items.extend(items)
+        self._rows = None
+        for item in items: self.groups.setdefault(item.group, {})[item] = True
+        self.revision += 1
+        self.endInsertRows()
+
+    def remove_items(self, items):
+        rows = sorted(set(row for row in (self.row_of(item) for item in items) if row is not None), reverse=True)
+        for row in rows: self.groups.get(self.items[row].group, {}).pop(self.items[row], None)
+        if rows: self.revision += 1
+        # remove from bottom in contiguous block, so remaining row number still valid
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first-1: first = rows.pop(0)
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            del self.items[first:last+1]
+            self._rows = None
+            self.endRemoveRows()
+
+    def regroup(self, item, old_group):
+        """move item to the bucket of its current group"""
+        if self.groups.get(old_group, {}).pop(item, None) is None: return
+        self.groups.setdefault(item.group, {})[item] = True
+        self.revision += 1
+
+    def clear(self):
+        self.beginResetModel()
+        self.items = []
+        self._rows = None
+        self.groups = {}
+        self.revision += 1
+        self.endResetModel()
+
+    def reorder(self, items):
+        """move row to follow the given order (same item as model), keep hidden row and index widget with their item"""
+        if items == self.items: return
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_items = [self.items[index.row()] for index in old_indexes]
+        self.items = list(items)
+        self._rows = None
+        moved = [(index, self.index_of(item)) for index, item in zip(old_indexes, old_items) if self.row_of(item) != index.row()]  # only row that changed place
+        if moved: self.changePersistentIndexList([old for old, new in moved], [new for old, new in moved])
+        self.layoutChanged.emit()
+
+    def move_item(self, item, row):
+        """move single row, view only shift the row between old and new place"""
+        old_row = self.row_of(item)
+        if old_row is None or old_row == row: return
+        self.beginMoveRows(QtCore.QModelIndex(), old_row, old_row, QtCore.QModelIndex(), row+1 if row > old_row else row)   # destination count the row before it's removed
+        self.items.insert(row, self.items.pop(old_row))
+        self._rows = None
+        self.endMoveRows()
+
+    def refresh_item(self, item):
+        index = self.index_of(item)
+        if index.isValid(): self.dataChanged.emit(index, index)
+
+class EZMAssetListView(QtWidgets.QListView):
+    """
+    virtualized asset container, only visible row is painted. 
+    keep the same api as InteractiveItemContainer (selected_item, modify_selection, reset_selection...) so command doesn't need to know
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # system data (contain selected item inside list)
+        self._selected_item = []
+        self.hovered_button = None  # (item, button name) under mouse, for highlight
+
+        self.asset_model = EZMAssetListModel(self)
+        self.asset_delegate = EZMAssetDelegate(self)
+        self.setModel(self.asset_model)
+        self.setItemDelegate(self.asset_delegate)
+
+        self.initUI()
+
+    @property
+    def selected_item(self):
+        return self._selected_item
+    
+    @selected_item.setter
+    def selected_item(self, value):
+        self._selected_item = value
+        self.onModifySelectedItem()
+
+    def initUI(self):
+        self.setObjectName('assetListView')
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(QtCore.Qt.WA_Hover)
+        self.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)    # selection handled by item like InteractiveItemContainer
+        self.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        self.setLayoutMode(QtWidgets.QListView.Batched)
+        self.setBatchSize(200)
+        self.setSpacing(2)
+        self.setFrameShape(QtWidgets.QFrame.NoFrame)
+
+    def get_all_item(self):
+        return list(self.asset_model.items)
+
+    def add_item(self, instance):
+        """helper function to add item that doesnt have container"""
+        self.add_items([instance])
+
+    def add_items(self, items):
+        for item in items: item.container = self
+        self.asset_model.append_items(items)
+
+    def remove_item(self, items):
+        """removing item but doesnt delete the item, only detach from container"""
+        for item in items:
+            item.selected = False   # prevent bug, when undo item on select mode
+        self.asset_model.remove_items(items)
+        for item in items:
+            item.container = None    # remove container also (it can be a way for item to detect if it already removed)
+        removed = set(items)
+        new_selected = [item for item in self.selected_item if item not in removed]
+        self.selected_item = new_selected
+
+    def clear_all_item(self):
+        """only detach but still preserve the item"""
+        self.asset_model.clear()
+        self.deselect_all()
+
+    def update_item(self, item):
+        self.asset_model.refresh_item(item)
+
+    def reorder_item(self, items):
+        self.asset_model.reorder(items)
+
+    def move_item(self, item, row):
+        self.asset_model.move_item(item, row)
+
+    def scroll_to_item(self, item):
+        index = self.asset_model.index_of(item)
+        if index.isValid(): self.scrollTo(index)
+
+    def toggle_item_widget(self, item, widget):
+        """attach widget below the row (struct detail), row height follow delegate size hint"""
+        index = self.asset_model.index_of(item)
+        if not index.isValid(): return
+        if self.indexWidget(index) is not widget: self.setIndexWidget(index, widget)
+        self.relayout()
+
+    def relayout(self):
+        self.scheduleDelayedItemsLayout()
+
+    def modify_selection(self, item, add=False):
+        """add or remove selection to container .like cmds.select in maya"""
+        if add:
+            if item in self.selected_item: return
+            self.selected_item.append(item)
+            item.selected = True
+        else:
+            self.reset_selection([item])
+
+    def reset_selection(self, new_selection=None):
+        """If nothing given, will basically clear anything. if given will clear anything and select the given arg"""
+        for item in self.selected_item:
+            item.selected = False
+        self.selected_item.clear()
+        if new_selection:
+            self.selected_item = list(new_selection)  # to trigger modified selection
+            for item in new_selection:
+                item.selected = True
+
+    def deselect_item(self, items):
+        for item in items:
+            if item in self.selected_item:
+                item.selected = False
+                self.selected_item.remove(item)
+
+    def deselect_all(self):
+        if self.selected_item:
+            for item in self.selected_item:
+                item.selected = False
+            self.selected_item = []
+
+    def onModifySelectedItem(self):
+        """virtual function when selected item assigned with value"""
+
+    def onClickEmpty(self, event):
+        """virtual function when clicking area without asset"""
+
+    def onClickCtrl(self, item):
+        if item.selected:
+            self.selected_item.remove(item)
+            item.selected = False
+        else:
+            self.modify_selection(item, add=True)
+
+    def onClickShift(self, item):
+        if self.selected_item:
+            last_index = self.asset_model.row_of(self.selected_item[-1])
+            current_index = self.asset_model.row_of(item)
+            for index in range(min(last_index, current_index), max(last_index, current_index)+1):
+                if not self.isRowHidden(index): self.modify_selection(self.asset_model.items[index], add=True)
+        else:
+            self.modify_selection(item, add=True)
+
+    def button_at(self, pos):
+        """return (item, button name) under pos, button name is None if not on any button"""
+        index = self.indexAt(pos)
+        if not index.isValid(): return None, None
+        item = index.data(EZMAssetListModel.ItemRole)
+        rects = self.asset_delegate.get_rects(self.visualRect(index), item, self.fontMetrics())
+        for button in ('status', 'detail', 'deadline', 'path'):
+            if button in rects and rects[button].contains(pos):
+                return item, button
+        if rects['name'].contains(pos): return item, 'name'
+        return item, None
+
+    def mousePressEvent(self, event):
+        item, button = self.button_at(event.position().toPoint())
+        if not item:
+            self.onClickEmpty(event)
+            return
+        if event.button() != QtCore.Qt.LeftButton: return
+        if button == 'detail': item.toggle_detail()
+        elif button == 'deadline': item.go_to_assignment()
+        elif button == 'path': item.go_to_path()
+        elif event.modifiers() & QtCore.Qt.ShiftModifier: self.onClickShift(item)
+        elif event.modifiers() & QtCore.Qt.ControlModifier: self.onClickCtrl(item)
+        else: self.reset_selection([item])
+        item.mousePressEvent(event)
+
+    def mouseDoubleClickEvent(self, event):
+        item, button = self.button_at(event.position().toPoint())
+        if not item or event.button() != QtCore.Qt.LeftButton: return
+        if button == 'name': self.edit(self.asset_model.index_of(item))
+        elif button is None or button == 'status': item.mouseDoubleClickEvent(event)
+        else: self.mousePressEvent(event)   # quick second click on button still count as click
+
+    def mouseMoveEvent(self, event):
+        item, button = self.button_at(event.position().toPoint())
+        hovered = (item, button) if button in ('detail', 'deadline', 'path') else None
+        if hovered != self.hovered_button:
+            self.hovered_button = hovered
+            self.viewport().update()
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self.hovered_button = None
+        self.viewport().update()
+        super().leaveEvent(event)
+
+class EZMAssetDelegate(QtWidgets.QStyledItemDelegate):
+    """paint asset row (status, icon, name, deadline, path button) in place of widget per asset"""
+    ROW_HEIGHT = 42
+    BUTTON_COLOR = {'detail': ('white', 1), 'deadline': ('orange', 1), 'path': ('white', 0.7)}
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.pixmaps = {}   # (icon, size, color, strength) : pixmap, shared by all row
+
+    def get_pixmap(self, icon, size, color=None, strength=0):
+        key = (icon, size, color, strength)
+        if key not in self.pixmaps:
+            pixmap = icon_cache.pixmap(get_path(icon, icon=True), (size, size))
+            if color:   # same look as highlight in GraphicButton
+                pixmap = pixmap.copy()  # tint a copy, plain pixmap is shared through icon cache
+                painter = QtGui.QPainter(pixmap)
+                painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceAtop)
+                tint = QtGui.QColor(color)
+                tint.setAlphaF(strength*0.6)
+                painter.fillRect(pixmap.rect(), tint)
+                painter.end()
+            self.pixmaps[key] = pixmap
+        return self.pixmaps[key]
+
+    def get_rects(self, rect, item, metrics):
+        """row geometry, used by paint and mouse hit test on view"""
+        center = rect.y() + self.ROW_HEIGHT/2
+        x = rect.x() + 10
+        right = rect.right() - 10
+        rects = {}
+        rects['status'] = QtCore.QRect(x, center-12, 24, 24)
+        rects['icon'] = QtCore.QRect(x+30, center-14, 28, 28)
+        x += 66
+        if isinstance(item, EZMAssetStruct):
+            rects['detail'] = QtCore.QRect(x, center-6, 12, 12)
+            x += 20
+        rects['path'] = QtCore.QRect(right-16, center-8, 16, 16)
+        right -= 24
+        if item.date_assignment:
+            rects['deadline'] = QtCore.QRect(right-16, center-8, 16, 16)
+            right -= 24
+            if item.status != 2:
+                days_width = metrics.horizontalAdvance('%s days'%item.days_left)
+                rects['days'] = QtCore.QRect(right-days_width, center-10, days_width, 20)
+                right -= days_width + 8
+        rects['name_area'] = QtCore.QRect(x, center-12, max(right-x, 0), 24)
+        name_width = min(metrics.horizontalAdvance(item.name)+4, rects['name_area'].width())
+        rects['name'] = QtCore.QRect(x, center-12, name_width, 24)
+        return rects
+
+    def draw_pixmap(self, painter, rect, pixmap):
+        """draw pixmap centered in rect"""
+        x = rect.x() + (rect.width()-pixmap.width())/2
+        y = rect.y() + (rect.height()-pixmap.height())/2
+        painter.drawPixmap(int(x), int(y), pixmap)
+
+    def paint(self, painter, option, index):
+        item = index.data(EZMAssetListModel.ItemRole)
+        rects = self.get_rects(option.rect, item, option.fontMetrics)
+        painter.save()
+
+        # border
+        if item.selected: border = '#FFA500'
+        elif option.state & QtWidgets.QStyle.State_MouseOver: border = '#1363bf'
+        else: border = '#101010'
+        painter.setPen(QtGui.QColor(border))
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRect(option.rect.adjusted(0, 0, -1, -1))
+
+        # icon
+        self.draw_pixmap(painter, rects['status'], self.get_pixmap(item.get_status_icon(), 24))
+        self.draw_pixmap(painter, rects['icon'], self.get_pixmap(item.get_icon(), 28))
+        if isinstance(item, EZMAssetStruct) and item.file_valid is False:
+            painter.drawPixmap(rects['icon'].topLeft(), self.get_pixmap('warning2.png', 15))
+
+        # button
+        for button in ('detail', 'deadline', 'path'):
+            if button not in rects: continue
+            if button == 'detail': icon = 'expand.png' if item.collapsed else 'collapse.png'
+            elif button == 'deadline': icon = 'timer.png'
+            else: icon = 'external_link.png'
+            if self.view.hovered_button == (item, button): pixmap = self.get_pixmap(icon, rects[button].width(), *self.BUTTON_COLOR[button])
+            else: pixmap = self.get_pixmap(icon, rects[button].width())
+            self.draw_pixmap(painter, rects[button], pixmap)
+
+        # text
+        painter.setFont(option.font)
+        if item.valid is None: painter.setPen(QtGui.QColor('#909090'))  # path not checked yet
+        else: painter.setPen(QtGui.QColor('white' if item.valid else '#FF6E70'))
+        name = option.fontMetrics.elidedText(item.name, QtCore.Qt.ElideRight, rects['name_area'].width())
+        painter.drawText(rects['name_area'], QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, name)
+        if 'days' in rects:
+            painter.setPen(QtGui.QColor(item.get_deadline_color()))
+            painter.drawText(rects['days'], QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter, '%s days'%item.days_left)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        item = index.data(EZMAssetListModel.ItemRole)
+        height = self.ROW_HEIGHT
+        if isinstance(item, EZMAssetStruct) and not item.collapsed and item.detail_widget:
+            height += item.detail_widget.sizeHint().height() + 6
+        return QtCore.QSize(200, height)
+
+    def createEditor(self, parent, option, index):
+        return QtWidgets.QLineEdit(parent)
+
+    def setEditorData(self, editor, index):
+        editor.setText(index.data(EZMAssetListModel.ItemRole).name)
+        editor.selectAll()
+
+    def setModelData(self, editor, model, index):
+        # rename only if text not empty or same as previous text
+        item = index.data(EZMAssetListModel.ItemRole)
+        if editor.text() != '' and editor.text() != item.name: item.renameEvent(editor.text())
+
+    def updateEditorGeometry(self, editor, option, index):
+        item = index.data(EZMAssetListModel.ItemRole)
+        if isinstance(editor, EZMAssetStructDetail):
+            if item.collapsed: editor.hide()
+            else: editor.setGeometry(option.rect.adjusted(20, self.ROW_HEIGHT, -6, -6))
+        else:
+            editor.setGeometry(self.get_rects(option.rect, item, option.fontMetrics)['name_area'])
+
+    def destroyEditor(self, editor, index):
+        # struct detail is kept by struct, it's only detached when row removed
+        if isinstance(editor, EZMAssetStructDetail):
+            editor.struct.collapsed = True
+            editor.hide()
+            editor.setParent(None)
+        else: super().destroyEditor(editor, index)
+
+class EZMAssetStructDetail(QtWidgets.QFrame):
+    """detail shown below expanded struct (current file and older version), built the first time user expand struct"""
+    def __init__(self, struct):
+        super().__init__()
+        self.struct = struct
+        self._height = 0
+        self.version_rows = {}  # VersionRecord : EZMAssetVersion, row built only with the detail
+
+        self.initUI()
+        for version in self.struct.file_version: self.add_version(version)
+        self.update_file()
+        self.eval()
+
+    def initUI(self):
+        self.setObjectName('struct_detail')
+        self.setContentsMargins(20,0,0,0)
+        self.setStyleSheet('QFrame#struct_detail{border: 1px solid #505050}') #1363bf > blue
+        self.detail_layout = QtWidgets.QVBoxLayout(self)
+        self.file_layout = QtWidgets.QHBoxLayout()
+        self.old_ver_layout = QtWidgets.QVBoxLayout()
+
+        self.file_icon = custom_widget.ValidableGraphicLabel(get_path(self.struct.get_file_icon(), icon=True), (24,24))
+        self.file_lbl = custom_widget.LimitedLabel(os.path.basename(self.struct.file), 99)
+
+        # old version widget configuration
+        self.old_file_widget = custom_widget.ExpandableWidget()
+        self.folder_icon = custom_widget.GraphicLabel(get_path('folder.png', icon=True), (20,20))
+        self.other_ver_lbl = QtWidgets.QLabel('version [0 items]')
+
+        self.old_file_widget.header_layout.insertWidget(0, self.folder_icon)
+        self.old_file_widget.header_layout.insertWidget(1, self.other_ver_lbl)
+        self.old_file_widget.header_layout.addStretch()
+
+        self.file_layout.addWidget(self.file_icon)
+        self.file_layout.addWidget(self.file_lbl)
+
+        self.old_ver_layout.addWidget(self.old_file_widget)
+
+        self.detail_layout.addLayout(self.file_layout)
+        self.detail_layout.addLayout(self.old_ver_layout)
+
+    def add_version(self, version):
+        row = EZMAssetVersion(self.struct, version)
+        self.version_rows[version] = row
+        self.old_file_widget.add_item(row)
+        self.update_version_count()
+
+    def remove_version(self, version):
+        row = self.version_rows.pop(version, None)
+        if row:
+            row.setParent(None)
+            row.deleteLater()
+        self.update_version_count()
+
+    def update_version_count(self):
+        self.other_ver_lbl.setText('version [%s items]'%len(self.struct.file_version))
+
+    def update_file(self):
+        self.file_lbl.setText(os.path.basename(self.struct.file))
+        self.file_icon.change_icon(get_path(self.struct.get_file_icon(), icon=True))
+
+    def eval(self):
+        if file_status.exists(self.struct.file): 
+            self.file_icon.set_valid(True)
+            self.file_icon.setToolTip(None)
+            set_style_property(self.file_lbl, 'missing', False)
+        else: 
+            self.file_icon.set_valid(False)
+            self.file_icon.setToolTip('file missing')
+            set_style_property(self.file_lbl, 'missing', True)
+        for row in self.version_rows.values(): row.eval()
+
+    def event(self, event):
+        # row height depend on this widget (ex. expand older version), ask list to layout again when size changed
+        result = super().event(event)
+        if event.type() == QtCore.QEvent.LayoutRequest and self.struct.container:
+            height = self.sizeHint().height()
+            if height != self._height:
+                self._height = height
+                self.struct.container.relayout()
+        return result
 
 class EZMAssetSplitter(QtWidgets.QFrame):
 
@@ -1146,6 +1823,7 @@ class EZMAssetDetail(QtWidgets.QTabWidget):
         self._has_selected = False
 
         self._lock_desc = True
+        self.preview_loader = ThumbnailLoader()    # preview decoded on worker, selecting asset never wait for it
 
         self.initUI()
         self.initConnection()
@@ -1264,6 +1942,20 @@ class EZMAssetDetail(QtWidgets.QTabWidget):
         screenshot_dialog = EZMScreenshotEdit(self.current_asset ,self)
         screenshot_dialog.captureImg()
 
+    def show_preview(self, path):
+        """preview decoded before is shown right away, otherwise placeholder is shown until worker finished"""
+        pixmap = icon_cache.find(path, (PREVIEW_SIZE, PREVIEW_SIZE)) if path else None
+        if pixmap:
+            self.preview_loader.cancel()
+            self.thumbnail_lbl.change_pixmap(path, pixmap)
+            return
+        self.thumbnail_lbl.change_icon(get_path('no_preview.png', icon=True),(160,160))
+        if path: self.preview_loader.load(path, PREVIEW_SIZE, self.preview_loaded)  # missing file is found by the worker, placeholder stay
+        else: self.preview_loader.cancel()
+
+    def preview_loaded(self, path, pixmap):
+        if pixmap and self.current_asset and self.current_asset.preview == path: self.thumbnail_lbl.change_pixmap(path, pixmap)
+
     def toggle_edit_desc(self, event):
         if not self.lock_desc:  # save notes to asset
             self.current_asset.notes = self.notes_edit.toPlainText()
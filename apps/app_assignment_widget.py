@@ -2,6 +2,7 @@
 TODO: use NTP or any other method that always try to sync the date, prevent when localtime is not accurate
 """
 from collections import OrderedDict
+from contextlib import contextmanager
 
 from PySide6 import QtCore, QtWidgets, QtGui
 
@@ -34,6 +35,8 @@ class EZMCalendarWidget(QtWidgets.QWidget):
         self.date_obj = {}  # date (year, month, day) (key) : date widget
         
         self._is_modified = False
+        self._update_hold = 0   # update_calendar wait until held block end (command changing many asset)
+        self._update_pending = False
 
         super().__init__()
         self.initUI()
@@ -111,9 +114,24 @@ class EZMCalendarWidget(QtWidgets.QWidget):
         except Exception as e: print('ERROR whike saving calendar data: ' + str(e))
 
     def update_calendar(self):
+        if self._update_hold:
+            self._update_pending = True
+            return
         for date in self.date_obj:
             self.date_obj[date].update()
 
+    @contextmanager
+    def hold_update(self):
+        """update calendar once after the block instead of once per asset"""
+        self._update_hold += 1
+        try:
+            yield
+        finally:
+            self._update_hold -= 1
+            if not self._update_hold and self._update_pending:
+                self._update_pending = False
+                self.update_calendar()
+
     def load_calendar(self, year, month):
         if DEBUG: print('loading calendar > month: %s and year: %s'%(month, year))
         self.clear_calendar()
@@ -195,9 +213,9 @@ class EZMCalendarWidget(QtWidgets.QWidget):
     
         # refresh ui
         if self.selectedDate:
-            self.selectedDate.setStyleSheet('EZMDateWidget#dateFrame{border: 0px solid #101010}')
+            set_style_property(self.selectedDate, 'state', '')
         self.selectedDate = date
-        date.setStyleSheet('EZMDateWidget#dateFrame{border: 1px solid #FFA500}')
+        set_style_property(date, 'state', 'selected')
 
     def next_page(self, event):
         year, month = calendar._nextmonth(self.previewed_year_month[0], self.previewed_year_month[1])
@@ -344,21 +362,21 @@ class EZMDateWidget(QtWidgets.QFrame):
     def enterEvent(self, event):
         if self.calendar.selectedDate == self: return
         #self.setStyleSheet('EZMDateWidget#dateFrame{background-color:#ff4da6}')
-        self.setStyleSheet('EZMDateWidget#dateFrame{border: 1px solid #FFFFFF}')
+        set_style_property(self, 'state', 'hovered')   # border from dark.qss
 
     def leaveEvent(self, event):
         if self.calendar.selectedDate == self: return
         #self.setStyleSheet('EZMDateWidget#dateFrame{background-color:none}')
-        self.setStyleSheet('EZMDateWidget#dateFrame{border: 0px solid #101010}')
+        set_style_property(self, 'state', '')
 
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
             # check if calendar has other selected present
             if self.calendar.selectedDate :
-                self.calendar.selectedDate.setStyleSheet('EZMDateWidget#dateFrame{border: 0px solid #101010}')
+                set_style_property(self.calendar.selectedDate, 'state', '')
             self.calendar.selectedDate = self
             self.calendar.detail_tab.load_detail(self.active_assignment.values(), self.active_todolist)
-            self.setStyleSheet('EZMDateWidget#dateFrame{border: 1px solid #FFA500}')
+            set_style_property(self, 'state', 'selected')
 
     def update_todolist_data(self, modified=True):
         """will always update to calendar editor all to_do data, to keep up with latest changes"""
@@ -3,15 +3,17 @@ from commands import *
 
 DEBUG = True
 
+HISTORY_LIMIT = 8*1024*1024 # memory (byte) history stamp may hold beside data program already has
+
 class EZMHistory():
     """Contains code for undo/redo for ez manager application"""
-    def __init__(self, program):
+    def __init__(self, program, limit=HISTORY_LIMIT):
 
         self.program = program
 
         self.history_stack = []
         self.current_step = -1
-        self.limit = 10
+        self.limit = limit  # oldest stamp is dropped when stamps hold more memory than this
 
         self.clear()
         self.storeInitialHistoryStamp() # serialize initial config of program
@@ -48,18 +50,22 @@ class EZMHistory():
         if self.current_step+1 < len(self.history_stack):
             self.history_stack = self.history_stack[0:self.current_step+1]
 
-        # history is outside of the limit
-        if self.current_step+1 >= self.limit:
-            self.history_stack = self.history_stack[1:]
-            self.current_step -= 1
-
         # create history stamp containing the data
         history_stamp = self.createHistoryStamp(desc)
         self.history_stack.append(history_stamp)
 
         self.current_step += 1
+
+        # history is outside of the limit, always keep current stamp
+        while len(self.history_stack) > 1 and self.stack_size() > self.limit:
+            self.history_stack = self.history_stack[1:]
+            self.current_step -= 1
         if DEBUG: print('store history:: current step > %s of %s [%s]'%(self.current_step, len(self.history_stack)-1, self.history_stack[self.current_step]['desc']))
 
+    def stack_size(self):
+        """memory held by history stamp, program decide which part is shared with its own data"""
+        return self.program.snapshot_size([history_stamp['snapshot'] for history_stamp in self.history_stack])
+
     def restoreHistory(self):
         if DEBUG: print ('restore history:: current step > %s of %s [%s]'%(self.current_step, len(self.history_stack)-1, self.history_stack[self.current_step]['desc']))
         self.restoreHistoryStamp(self.history_stack[self.current_step])
@@ -8,6 +8,7 @@ from app_projects_widget import EZMProjectBrowser, EZMProjectItem
 from app_assets_widget import EZMAssetManager
 from app_extra_widget import EZMProjectWindow, EZMSettings
 from app_history import *
+from storage import SAVE_DELAY
 from util import *
 
 import json
@@ -230,6 +231,7 @@ class EZMToolbar(QtWidgets.QWidget):
         self.change_page(PROJECT_MENU)
         
     def go_to_asset(self, project):
+        self.project_browser.open_project(project)   # asset view only built for opened project
         self.active_project = project
         self.asset_manager.current_project = self.active_project
         self.set_project_label(project.name)
@@ -239,6 +241,12 @@ class EZMToolbar(QtWidgets.QWidget):
         return self.current_history
 
     def project_sorter_changed(self, event):
+        if not event: event = self.project_sorter.currentText()  # sort project again with current text
+        if self.sort_project(event): self.onModified()
+
+    def sort_project(self, event):
+        """move project widget to sorted order and sort project paths the same way, return False if sorter doesn't sort"""
+        if event not in ('Name', 'Category'): return False  # 'Last Updated' keep current order
         sorted_item = []
         project_amount = self.project_browser.project_container.main_layout.count()
         all_project = self.project_browser.project_container.get_all_item()
@@ -250,24 +258,17 @@ class EZMToolbar(QtWidgets.QWidget):
 
         if event == 'Name': 
             project_name_list = [[item.name, item] for item in valid_project]
-            self.sort_project_by_alphabet(valid_project, invalid_amount, project_name_list, sorted_item)
+            self.sort_project_by_alphabet(project_name_list, sorted_item)
         if event == 'Category': 
             project_category_list = [[item.category, item] for item in valid_project]
-            self.sort_project_by_alphabet(valid_project, invalid_amount, project_category_list, sorted_item)
-        if event == 'Last Updated':
-            return
-        if not event:
-            #if DEBUG: print ('sort project again with current text')
-            self.project_sorter_changed(self.project_sorter.currentText())
-            return 
+            self.sort_project_by_alphabet(project_category_list, sorted_item)
+        self.project_browser.project_container.reorder(sorted_item)  # one relayout for every moved project
         self.sort_project_paths(sorted_item)
-        self.onModified()
+        return True
 
-    def sort_project_by_alphabet(self, valid_project, invalid_amount, project_list, sorted_list):
+    def sort_project_by_alphabet(self, project_list, sorted_list):
         by_alphabet_project = sorted([item for item in project_list], key=lambda x: x[0].lower())
-        for index in range(len(valid_project)):
-            self.project_browser.project_container.main_layout.insertWidget(invalid_amount+index, by_alphabet_project[index][1])
-            sorted_list.append(by_alphabet_project[index][1])
+        sorted_list.extend(item[1] for item in by_alphabet_project)
 
     def sort_project_paths(self, project_list): 
         """sort project paths by list of project"""
@@ -307,10 +308,10 @@ class EZMToolbar(QtWidgets.QWidget):
         self.project_sorter_changed(None)
         self.onModified()
         
-    def delete_project_reference(self, item):
+    def delete_project_reference(self, item, save=True):
         key = self.get_project_path_from_object(item)
         del self.project_paths[key]
-        self.onModified()
+        if save: self.onModified()
 
     def load_config(self):
         # mean to be called once when open app only
@@ -340,6 +341,8 @@ class EZMToolbar(QtWidgets.QWidget):
         current_asset_sorter = self.asset_sorter.currentIndex()
         dict = OrderedDict([('project_sorter_index', current_project_sorter),
                             ('asset_sorter_index', current_asset_sorter),
+                            ('save_delay', self.project_browser.save_scheduler.delay),
+                            ('storage_mode', self.project_browser.storage_mode),
                             ('projects', list(self.project_paths.keys()))])
     
         return dict
@@ -347,7 +350,15 @@ class EZMToolbar(QtWidgets.QWidget):
     def deserialize(self, data):
         self.project_sorter.setCurrentIndex(data['project_sorter_index'])
         self.asset_sorter.setCurrentIndex(data['asset_sorter_index'])
-        self.project_browser.load_project(data['projects'])
+        self.project_browser.save_scheduler.delay = data.get('save_delay', SAVE_DELAY) # quiet period (ms) before project saved
+        self.project_browser.storage_mode = data.get('storage_mode', 'json')    # 'journal' append change to project journal, 'sqlite' write to database
+        self.project_browser.load_project(data['projects'], self.project_loaded)
+
+    def project_loaded(self):
+        """project arrive after initial history is stored, start the history again from loaded project"""
+        if not self.project_browser.history_stack: return
+        self.project_browser.history_stack.clear()
+        self.project_browser.history_stack.storeInitialHistoryStamp()
 
 class EZMProjectLabel(custom_widget.LabelButton):
     def __init__(self, text, callback=None, color=QtGui.QColor('white'), strength=0.25):
@@ -5,20 +5,35 @@ from PySide6 import QtCore, QtWidgets, QtGui
 from app_assets_widget import EZMAssetItem, EZMAssetStruct
 from app_extra_widget import EZMGetStarted
 from app_history import *
+from core import ProjectRecord, StructRecord
+from storage import SaveScheduler, ProjectJournal, ProjectLoader, SQLiteProjectStore, SnapshotCache, LoadCanceled, JOURNAL_SUFFIX
+from storage import read_project_file, write_json_atomic
 from util import *
 
 import json
+import sys
 
 import custom_widget
 
 DEBUG = True
 
+MATERIALIZED_PROJECT_LIMIT = 3  # project keeping all asset view in memory, least recently opened one is evicted
+
 class EZMProjectBrowser(QtWidgets.QWidget):
     def __init__(self, top_widget):
         super().__init__()
         self.top_widget = top_widget
 
         self.history_stack = None   # let toolbar finish loading, finally assign the history stack (inside initUndo)
+        self.history_entries = {}   # project path : last history entry, reused while project header stay the same
+        self.materialized_project = OrderedDict()   # project with asset view built, ordered from least recently opened
+        self.save_scheduler = SaveScheduler()   # project file written in background after burst of modification
+        self.storage_mode = 'json'  # 'json' rewrite whole project file, 'journal' append change to journal next to it, 'sqlite' write to database
+        self.journals = {}  # project path : ProjectJournal
+        self.store = None   # SQLiteProjectStore, opened on first use
+        self.snapshot_cache = SnapshotCache(os.path.join(get_path(), 'data', 'cache'))  # parsed project for faster start
+        self.project_loader = ProjectLoader(self.read_project, self.apply_project)   # project file read on worker thread
+        self.project_loader.progress.connect(self.update_loading_progress)
 
         self.setAcceptDrops(True)
 
@@ -86,7 +101,7 @@ class EZMProjectBrowser(QtWidgets.QWidget):
         self.project_container.main_layout.insertWidget(0, item)
         self.top_widget.project_paths[path] = item
 
-    def close_project(self, project, confirmation=True):
+    def close_project(self, project, confirmation=True, save=True):
         """close project only accept list"""
         if confirmation:
             if len(project) > 1: window_title = "Close {0} selected project".format(len(project))
@@ -100,16 +115,29 @@ class EZMProjectBrowser(QtWidgets.QWidget):
         if confirmation and confirm == QtWidgets.QMessageBox.Yes: 
             self.project_container.deselect_all()   # clean C++ internal object reference
             for item in project:
+                self.materialized_project.pop(item, None)
                 item.deleteLater()
                 item.setParent(None)
-                self.top_widget.delete_project_reference(item)
+                self.top_widget.delete_project_reference(item, save=False)
+            self.top_widget.onModified()    # save config once
             return True
         
         if not confirmation:
             self.project_container.deselect_all()
+            self.materialized_project.pop(project, None)
             project.deleteLater()
             project.setParent(None)
-            self.top_widget.delete_project_reference(project)
+            self.top_widget.delete_project_reference(project, save)
+
+    def open_project(self, project):
+        """build asset view of project before showing it, evict least recently opened project above limit"""
+        self.materialized_project.pop(project, None)
+        self.materialized_project[project] = True
+        project.materialize()
+        while len(self.materialized_project) > MATERIALIZED_PROJECT_LIMIT:
+            old_project, _ = self.materialized_project.popitem(last=False)
+            if DEBUG: print('evict asset view of project: %s'%old_project.name)
+            old_project.dematerialize()
 
     def is_project_path_exists(self, path, exclude=[]):
         """Check if project inside browser has the same root path, avoid editing same root with different project"""
@@ -120,15 +148,96 @@ class EZMProjectBrowser(QtWidgets.QWidget):
     def onModified(self, project=None):
         """only serve to update project data with serialization"""
         if DEBUG: print('Project browser: on modified called')
-        # eval all project without exception (cuz it's light performance)
-        for item in self.project_container.get_all_item(): 
-            if isinstance(item, EZMProjectItem): item.eval()    # name item, cause we don't override project variable passed to this function
         if project:
+            project.set_dirty() # caller tell this project has changed
             path = self.top_widget.get_project_path_from_object(project)
-            self.save_project(path, project)
-        else:   # if no project specified, just save all current project
-            for path in list(self.top_widget.project_paths.keys()):
-                self.save_project(path, self.top_widget.project_paths[path])
+            project.eval()
+            self.schedule_save(path, project)
+        else:   # if no project specified, save all project changed since last save
+            for path, item in list(self.top_widget.project_paths.items()):
+                if isinstance(item, EZMProjectItem) and item.record.dirty:
+                    item.eval()
+                    self.schedule_save(path, item)
+
+    def schedule_save(self, path, project):
+        """save project later in background, burst of modification only written once"""
+        if isinstance(project, EZMProjectItem):
+            record = project.record # taken on GUI thread, worker only touch the record
+            record.dirty = False    # anything changed after this schedule another save
+            journal = self.journals.get(path)
+            if journal:
+                self.save_scheduler.schedule(path, self.cached_save(path, record, lambda: journal.write(record)))
+            elif self.storage_mode == 'journal':    # first save start from fresh snapshot
+                journal = self.journals[path] = ProjectJournal(path)
+                self.save_scheduler.schedule(path, self.cached_save(path, record, lambda: journal.compact(record)))
+            elif self.storage_mode == 'sqlite':
+                store = self.get_store()
+                self.save_scheduler.schedule(path, lambda: store.write(path, record))   # json isn't written
+            else:
+                self.save_scheduler.schedule(path, self.cached_save(path, record, lambda: write_json_atomic(path, record.to_dict())))
+        else:
+            print("WARNING: can't save project. might be missing content or data")
+
+    def cached_save(self, path, record, write):
+        """
+        save job that cache project json right after it's written, so next start (even after crash) skip parsing it.
+        record changed while writing doesn't match the json anymore, its next save cache it instead
+        """
+        def job():
+            if not record.is_loaded(): return write()
+            before = record.content_stamp()
+            write()
+            if os.path.exists(path + JOURNAL_SUFFIX) or self.snapshot_cache.is_current(path): return  # json not written or journal not merged yet
+            if record.content_stamp() == before: self.snapshot_cache.store(path, record)
+        return job
+
+    def get_store(self):
+        if self.store is None: self.store = SQLiteProjectStore(os.path.join(get_path(), 'data', 'projects.db'))
+        return self.store
+
+    def attach_storage(self, path, record, journal=None):
+        """
+        project with journal left from last session keep using the journal until compacted.
+        in sqlite mode project read from json is copied to database in background
+        """
+        if journal:
+            self.journals[path] = journal
+        elif self.storage_mode == 'sqlite' and path not in self.store.state:
+            store = self.get_store()
+            self.save_scheduler.schedule(path, lambda: store.import_project(path, record))
+
+    def merge_storage(self):
+        """merge journal and database change into project file so json stay up to date for sharing, called when app closed"""
+        for path, journal in list(self.journals.items()):
+            project = self.top_widget.project_paths.get(path)
+            if isinstance(project, EZMProjectItem):
+                self.save_scheduler.schedule(path, self.cached_save(path, project.record, lambda journal=journal, project=project: journal.compact(project.record)))
+        if self.store:
+            for path in list(self.store.state):
+                project = self.top_widget.project_paths.get(path)
+                if isinstance(project, EZMProjectItem) and path not in self.journals:
+                    self.save_scheduler.schedule(path, self.cached_save(path, project.record, lambda path=path, project=project: self.store.export(path, project.record)))
+
+    def update_snapshot_cache(self):
+        """cache project file not cached yet (save job cache json it wrote) and remove cache of closed project, called when app closed"""
+        for path, project in self.top_widget.project_paths.items():
+            if not isinstance(project, EZMProjectItem) or not project.record.is_loaded(): continue
+            if os.path.exists(path + JOURNAL_SUFFIX): continue  # json doesn't have journal change yet, record does
+            if os.path.exists(path) and not self.snapshot_cache.is_current(path): self.snapshot_cache.store(path, project.record)
+        self.snapshot_cache.prune(self.top_widget.project_paths)
+
+    def query_asset(self, project, group=None, sorter=None):
+        """uid of project asset from database index (see SQLiteProjectStore.query_asset), None if project isn't kept in database"""
+        if self.storage_mode != 'sqlite' or not self.store: return None
+        path = self.top_widget.get_project_path_from_object(project)
+        if path not in self.store.state or path in self.journals: return None
+        self.store.write(path, project.record)  # only changed row and position, database now match the view so the query is exact
+        return self.store.query_asset(path, group, sorter)
+
+    def find_asset_path(self, project, path, exclude=[]):
+        """name of asset owning path or None, project is already read when its asset view is open"""
+        record = project.record.find_asset(path, exclude)
+        return record.name if record else None
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
@@ -177,55 +286,106 @@ class EZMProjectBrowser(QtWidgets.QWidget):
             if res == importStruct:
                 self.import_project()
 
-    def load_project(self, paths):
+    def load_project(self, paths, finished=None):
+        """
+        read project file in background, placeholder is shown until its project arrive. project is added in the given order,
+        finished is called after every path is added
+        """
+        if self.storage_mode == 'sqlite': self.get_store()  # open database before loader thread use it
+        load_paths = []
         for path in paths:
             if not path: continue   # weird bug when user config project contain false
+            # check if project already loaded
+            if path in self.top_widget.project_paths: 
+                print('WARNING: project already loaded, skip')
+                continue
             if DEBUG: print('loading path > ', path)
-            try:
-                # check if project already loaded
-                if path in self.top_widget.project_paths: 
-                    print('WARNING: project already loaded, skip')
-                    return False
-                if os.path.exists(path):
-                    file = open(path, 'r')
-                    raw_data = file.read()
-                    if raw_data:
-                        try:
-                            data = json.loads(raw_data)
-                        
-                            # file checking passes
-                            if self.is_project_path_exists(data['path']):
-                                warning_path_already_exist(self, data['name'], data['path'])
-                                continue
-                            
-                            # initialize project and deserialize data
-                            project = EZMProjectItem(self, self.project_container)
-                            project.deserialize(data)
-
-                            # assign to application project paths dict
-                            self.top_widget.project_paths[path] = project
-                            self.show_hint(False)   # when one project loaded successfully, hide hint
-
-                        except:  
-                            self.add_missing_project(path, "Can't read file content")   # if json file is not valid throw error
-                            continue
-                    else:
-                        self.add_missing_project(path, 'Content not found')
-                else:
-                    self.add_missing_project(path)
-        
-            except Exception as e: print("can't load the project: %s"%e)
+            placeholder = EZMLoadingProjectItem(self, path)
+            self.project_container.main_layout.addWidget(placeholder)
+            self.top_widget.project_paths[path] = placeholder   # keep project order in config while loading
+            load_paths.append(path)
+        self.project_loader.load(load_paths, lambda: self.project_loaded(finished))
+
+    def read_project(self, path):
+        """
+        read project file to record, called on loader thread so no widget is touched here.
+        return (record, journal, project path exists) or warning text when project can't be read
+        """
+        journal = None
+        if self.store and self.storage_mode == 'sqlite' and self.store.is_current(path):
+            record = self.store.load(path)  # json unchanged since last sync, read from database instead
+        elif not os.path.exists(path):
+            return 'File not found '
+        elif not os.path.getsize(path):
+            return 'Content not found'
+        else:
+            record = self.snapshot_cache.load(path)
+            if record is None:
+                snapshot = self.snapshot_cache.snapshot_id(path)
+                try:
+                    record = read_project_file(path, lambda percent: self.project_loader.report(path, percent), lambda: self.project_loader.is_canceled(path))
+                except LoadCanceled: raise
+                except:
+                    return "Can't read file content"    # if json file is not valid throw error
+                self.snapshot_cache.store(path, record, snapshot)
+            journal = ProjectJournal(path)  # apply change not merged to project file yet
+            if journal.replay(record): journal.mark_saved(record)
+            else: journal = None
+        return record, journal, os.path.exists(record.path)
+
+    def apply_project(self, path, result):
+        """replace placeholder with project read by loader"""
+        placeholder = self.top_widget.project_paths.get(path)
+        if not isinstance(placeholder, EZMLoadingProjectItem): return  # closed while loading
+        index = self.project_container.main_layout.indexOf(placeholder)
+        placeholder.deleteLater()
+        placeholder.setParent(None)
+        if isinstance(result, Exception):
+            print("can't load the project: %s"%result)
+            result = "Can't read file content"
+        if isinstance(result, str):
+            self.add_missing_project(path, result)
+            return
+
+        record, journal, path_exists = result
+        # file checking passes
+        if self.is_project_path_exists(record.path):
+            warning_path_already_exist(self, record.name, record.path)
+            del self.top_widget.project_paths[path]
+            return
         
-        if paths: self.top_widget.project_sorter_changed(None)   # finally, trigger project sorter to refresh project order
+        # initialize project and build view over record
+        project = EZMProjectItem(self, self.project_container)
+        self.project_container.main_layout.insertWidget(index, project)
+        project.load_record(record, path_exists)
+        self.attach_storage(path, record, journal)
+
+        # assign to application project paths dict
+        self.top_widget.project_paths[path] = project
+        self.show_hint(False)   # when one project loaded successfully, hide hint
+
+    def update_loading_progress(self, path, percent):
+        placeholder = self.top_widget.project_paths.get(path)
+        if isinstance(placeholder, EZMLoadingProjectItem): placeholder.set_progress(percent)
+
+    def cancel_loading(self, path):
+        """stop reading project file and close it"""
+        self.project_loader.cancel(path)
+        placeholder = self.top_widget.project_paths.get(path)
+        placeholder.deleteLater()
+        placeholder.setParent(None)
+        self.top_widget.delete_project_reference(placeholder)
+
+    def project_loaded(self, finished=None):
+        self.top_widget.project_sorter_changed(None)   # finally, trigger project sorter to refresh project order
+        if finished: finished()
 
     def save_project(self, path, project):
         if os.path.exists(path) and isinstance(project, EZMProjectItem):
-            with open(path, 'w') as file:  
-                    file.write(json.dumps(project.serialize(), indent=4))
+            write_json_atomic(path, project.record.to_dict())
         elif isinstance(project, EZMProjectItem):
             print ('WARNING: file project not exist, create file again')
-            with open(path, 'w') as file:
-                file.write(json.dumps(project.serialize(), indent=4))
+            write_json_atomic(path, project.record.to_dict())
         else:
             print("WARNING: can't save project. might be missing content or data")
 
@@ -247,91 +407,128 @@ class EZMProjectBrowser(QtWidgets.QWidget):
             self.project_container.deselect_all()
 
     def serialize(self):
-        """Serialize neccessary info for project undo history, include project paths to identify object between history"""
-        project_list = []
-        all_project = self.project_container.get_all_item()
-        for project in all_project:
+        """
+        snapshot for project undo history, (project path, header, record) per project. entry of unchanged project is shared between snapshot.
+        asset is not copied as asset edit has its own undo stack, closed project come back with its record as it was closed
+        """
+        snapshot = []
+        entries = {}
+        for project in self.project_container.get_all_item():
             if isinstance(project, EZMProjectItem): # prevent missing object being listed 
-                object = project.serialize()
-                object['project_paths'] = self.top_widget.get_project_path_from_object(project) # serialize project_paths as it's the only way to identify object after user edit through browser
-                project_list.append(object)
-
-        result = OrderedDict([('project', project_list)])
-        return result
+                path = self.top_widget.get_project_path_from_object(project) # project paths is the only way to identify object after user edit through browser
+                header = tuple(project.record.header().values())
+                entry = self.history_entries.get(path)
+                if entry is None or entry[1] != header or entry[2] is not project.record: entry = (path, header, project.record)
+                entries[path] = entry
+                snapshot.append(entry)
+        self.history_entries = entries
+        return tuple(snapshot)
     
     def deserialize(self, data):
-        """Deserialize data from undo history"""
-        unmodified = list(self.top_widget.project_paths.values())   # contain current project that not modified, just close if found 
-        for project_data in data['project']:
-            if project_data['project_paths'] in self.top_widget.project_paths:  # if found same object, just reassign data/deserialize
-                project = self.top_widget.project_paths[project_data['project_paths']]
-                # rather than deserialize all data again, just assign project attribute
-                project.name = project_data['name']
-                project.category = project_data['category']
-                project.path = project_data['path']
-                project.thumbnail = project_data['thumbnail']
-                unmodified.remove(project)
-            elif project_data['project_paths'] not in self.top_widget.project_paths:   # if not found object, create one
+        """restore snapshot from undo history, only difference with current project is applied (close, create, update header)"""
+        current = {path: project for path, project in self.top_widget.project_paths.items() if isinstance(project, EZMProjectItem)}
+        snapshot_paths = set(path for path, header, record in data)
+        closed = [project for path, project in current.items() if path not in snapshot_paths]
+        changed = bool(closed)
+
+        self.project_container.setUpdatesEnabled(False) # repaint once after everything is applied
+        for project in closed: self.close_project(project, confirmation=False, save=False)
+        for path, header, record in data:
+            project = current.get(path)
+            if project is None:
+                if path in self.top_widget.project_paths: continue  # missing or loading item using the same path
+                # closed after the snapshot, create it again
                 project = EZMProjectItem(self, self.project_container)
-                project.deserialize(project_data)
-                self.top_widget.project_paths[project_data['project_paths']] = project
-        
-        if unmodified:
-            for project in unmodified:
-                if isinstance(project, EZMProjectItem):     # prevent missing item being closed, only user can close missing item
-                    self.close_project(project, confirmation=False)
-        self.top_widget.project_sorter_changed(None)    # call on modified update app config and file paths
+                project.load_record(record)
+                self.top_widget.project_paths[path] = project
+                changed = True
+            if tuple(project.record.header().values()) != header:
+                project.name, project.category, project.path, project.thumbnail = header
+                changed = True
+        if changed: self.top_widget.sort_project(self.top_widget.project_sorter.currentText())
+        self.project_container.setUpdatesEnabled(True)
+
+        if changed: self.top_widget.onModified()   # save config once
+
+    def snapshot_size(self, snapshots):
+        """memory held by history snapshot, shared entry is counted once and record only when its project is closed"""
+        open_records = set(id(project.record) for project in self.top_widget.project_paths.values() if isinstance(project, EZMProjectItem))
+        counted = set()
+        size = 0
+        for snapshot in snapshots:
+            size += sys.getsizeof(snapshot)
+            for entry in snapshot:
+                if id(entry) in counted: continue
+                counted.add(id(entry))
+                path, header, record = entry
+                size += sys.getsizeof(entry) + sys.getsizeof(header) + sum(sys.getsizeof(value) for value in header)
+                if id(record) not in open_records and id(record) not in counted:
+                    counted.add(id(record))
+                    size += record.memory_size()
+        return size
 
 class EZMProjectItem(custom_widget.InteractiveItem):
     def __init__(self, browser, container, name='project_template', category='Other', path='', thumbnail=''):
-        self.asset = [] # include asset item and asset struct
+        self.record = ProjectRecord(name, category, path, thumbnail)   # project data, this widget only show it
+        self._asset = None  # include asset item and asset struct (view of record.asset), built when project opened
+        self._views = {}    # {record: view} built early for asset with assignment, calendar need them before project opened
         self.all_asset_dues = []
 
         self.browser = browser
-        self._name = name
-        self._category = category
-        self._path = path
-        self._thumbnail = thumbnail
 
         super().__init__(container=container)    # call initUI at last
         self.initUndo()
 
+    @property
+    def asset(self):
+        if self._asset is None: self.materialize()
+        return self._asset
+    
+    @asset.setter
+    def asset(self, asset):
+        self._asset = asset
+        self.record.asset = [item.record for item in asset]  # keep record order same as view (reorder alone is not worth a save)
+
     @property
     def name(self):
-        return self._name
+        return self.record.name
     
     @name.setter
     def name(self, name):
-        self._name = name
-        self.name_label.setText(self._name)
+        self.record.name = name
+        self.set_dirty()
+        self.name_label.setText(name)
         
     @property
     def category(self):
-        return self._category
+        return self.record.category
     
     @category.setter
     def category(self, category):
-        self._category = category
+        self.record.category = category
+        self.set_dirty()
         icon = self.get_icon()
         self.category_icon.change_icon(icon)
 
     @property
     def path(self):
-        return self._path
+        return self.record.path
     
     @path.setter
     def path(self, path):
-        self._path = path
-        self.path_field.setText(self._path)
+        self.record.path = path
+        self.set_dirty()
+        self.path_field.setText(path)
 
     @property
     def thumbnail(self):
-        return self._thumbnail
+        return self.record.thumbnail
 
     @thumbnail.setter
     def thumbnail(self, thumbnail):
-        self._thumbnail = thumbnail
-        self.thumbnail_icon.change_icon(self._thumbnail)
+        self.record.thumbnail = thumbnail
+        self.set_dirty()
+        self.thumbnail_icon.change_icon(thumbnail)
 
     def initUI(self):
         self.project_font = QtGui.QFont('Ubuntu', 12)
@@ -350,7 +547,7 @@ class EZMProjectItem(custom_widget.InteractiveItem):
 
         self.name_label = custom_widget.ShortLabel(self.name, 70)
         self.name_label.setFont(self.project_font)
-        self.path_field = QtWidgets.QLineEdit(self._path)
+        self.path_field = QtWidgets.QLineEdit(self.path)
         self.path_field.setMinimumWidth(220)
         self.path_field.setReadOnly(True)
         self.path_btn = custom_widget.GraphicButton(get_path("external_link.png",icon=True),self.go_to_folder,QtGui.QColor("white"),0.7,(16,16))
@@ -395,11 +592,20 @@ class EZMProjectItem(custom_widget.InteractiveItem):
 
     def add_asset(self, file):
         self.asset.append(file)
+        self.record.add_asset(file.record)
+        self.set_dirty()
+
+    def set_dirty(self):
+        """mark project to be saved, onModified without project only save dirty project"""
+        self.record.dirty = True
 
     def remove_asset(self, selection):
         """remove asset by selection, accept list as an input"""
+        selection = set(selection)
         res = [item for item in self.asset if item not in selection]
         self.asset = res
+        for item in selection: self.record.unindex_asset(item.record)
+        self.set_dirty()
         # reload assignment to also delete the connected checklist if available
 
     def execute(self, command):
@@ -427,9 +633,9 @@ class EZMProjectItem(custom_widget.InteractiveItem):
         #self.path_editor = EZMPathEditor(self)
 
     def get_icon(self):
-        if self._category == "Animation":
+        if self.category == "Animation":
             return get_path("TV.png", icon=True)
-        elif self._category == "Game":
+        elif self.category == "Game":
             return get_path("game.png", icon=True)
         else:
             return get_path("package.png", icon=True)
@@ -455,75 +661,54 @@ class EZMProjectItem(custom_widget.InteractiveItem):
     #         self.active_assignment_lbl.setText("")
 
     def serialize(self):
-        # serialize asset 
-        asset_list = []
-        struct_list = []
-        for asset in self.asset:
-            if type(asset) is EZMAssetItem: # using type rather than isinstance to ignore inheritance
-                asset_list.append(asset.serialize())
-            elif type(asset) is EZMAssetStruct:
-                struct_list.append(asset.serialize())
-
-        dict = OrderedDict([('name', self.name),
-                            ('category', self.category),
-                            ('path', self.path),
-                            ('thumbnail', self.thumbnail),
-                            ('asset', asset_list),
-                            ('struct', struct_list)])
-        return dict
+        return self.record.to_dict()
 
     def deserialize(self, data):
-        # deserialize method here is assigning each data value to the instance
+        # deserialize method here is parsing data to record, then build asset view over each record
         try:
-            self.name = data['name']
-            self.category = data['category']
-            self.path = data['path']
-            self.thumbnail = data['thumbnail']
-            
-            new_asset = []
-            for asset_data in data['asset']:
-                asset = EZMAssetItem(self,
-                                        self.browser.top_widget.asset_manager.get_asset_scroll(),
-                                        asset_data['name'],
-                                        asset_data['path'],
-                                        asset_data['group'],
-                                        asset_data['date_modified'],
-                                        asset_data['type'],
-                                        asset_data['status'],
-                                        asset_data['date_assignment'],
-                                        asset_data['preview'],
-                                        asset_data['notes'])
-                new_asset.append(asset)
-
-            new_struct = []
-            for struct_data in data['struct']:
-                struct = EZMAssetStruct(self,
-                                        self.browser.top_widget.asset_manager.get_asset_scroll(),
-                                        struct_data['name'],
-                                        struct_data['path'],
-                                        struct_data['group'],
-                                        struct_data['date_modified'],
-                                        struct_data['type'],
-                                        struct_data['status'],
-                                        struct_data['file'],
-                                        struct_data['date_assignment'],
-                                        struct_data['preview'],
-                                        struct_data['notes'])
-                struct.deserialize(struct_data['file_version'])    # initialize file version if found
-                new_struct.append(struct)
-
-            self.asset = new_asset + new_struct
-            self.eval() # update ui
-
+            self.load_record(ProjectRecord.from_dict(data))
         except:  # canceled add project if deserialization failed
             print('PROBLEM DESERIALIZATION')
             self.browser.add_missing_project("path unavailable", "Can't read file content")   # if json file is not valid throw error
             self.setParent(None)
             self.deleteLater()
 
-    def eval(self):
+    def load_record(self, record, path_exists=None):
+        self.record = record
+        self.name = record.name
+        self.category = record.category
+        self.path = record.path
+        self.thumbnail = record.thumbnail
+
+        self.record.dirty = False   # just loaded, nothing to save
+        # only asset with assignment get view now (registered to calendar), the rest wait until project opened
+        self._asset = None
+        self._views = {}
+        for asset_record in record.assigned_asset(): self._views[asset_record] = self.create_asset_view(asset_record)
+        self.eval(path_exists) # update ui
+
+    def create_asset_view(self, record):
+        asset_scroll = self.browser.top_widget.asset_manager.get_asset_scroll()
+        if type(record) is StructRecord: return EZMAssetStruct.from_record(self, asset_scroll, record)
+        return EZMAssetItem.from_record(self, asset_scroll, record)
+
+    def materialize(self):
+        """build view for every asset record, reuse view already built for assignment"""
+        if self._asset is not None: return
+        self._asset = [self._views.get(record) or self.create_asset_view(record) for record in self.record.asset]
+        self._views = {}
+
+    def dematerialize(self):
+        """drop asset view to free memory, view with assignment is kept as calendar still reference it"""
+        if self._asset is None: return
+        self._views = {asset.record: asset for asset in self._asset if asset.date_assignment}
+        self._asset = None
+        self.history_stack.clear()  # command hold dropped view, can't undo them anymore
+
+    def eval(self, path_exists=None):
         """if project path inside json is not valid, raise warning. remember it's different from path for json, it's INSIDE json"""
-        if not os.path.exists(self.path): self.path_warning_lbl.show()
+        if path_exists is None: path_exists = os.path.exists(self.path)
+        if not path_exists: self.path_warning_lbl.show()
         else: self.path_warning_lbl.hide()
 
 class EZMMissingProjectItem(QtWidgets.QFrame):
@@ -564,8 +749,7 @@ class EZMMissingProjectItem(QtWidgets.QFrame):
                 file = open(self.path, 'r')
                 raw_data = file.read()
                 data = json.loads(raw_data)
-                self.project = EZMProjectItem(self.browser, None)   # pass None to container as cheating, to avoid ui being present. as we want only serialize function
-                self.project.deserialize(data)
+                self.project = ProjectRecord.from_dict(data)   # only data needed, no widget
             except Exception as e: print(e)
 
     def onClose(self, event):
@@ -592,4 +776,36 @@ class EZMMissingProjectItem(QtWidgets.QFrame):
     def save_project_file(self):
         if os.path.exists(self.path):
             with open(self.path, 'w') as file:  
-                file.write(json.dumps(self.project.serialize(), indent=4))
\ No newline at end of file
+                file.write(json.dumps(self.project.to_dict(), indent=4))
+class EZMLoadingProjectItem(QtWidgets.QFrame):
+    """placeholder shown in project browser while project file is being read, big file show its progress"""
+    def __init__(self, browser, path):
+        super().__init__()
+        self.browser = browser
+        self.path = path
+
+        self.setFrameStyle(QtWidgets.QFrame.StyledPanel | QtWidgets.QFrame.Plain)
+        self.setObjectName('loadingProject')
+        self.setStyleSheet('EZMLoadingProjectItem#loadingProject{border: 1px solid #505050}')
+
+        self.main_layout = QtWidgets.QHBoxLayout(self)
+        self.loading_lbl = QtWidgets.QLabel('<b style="color:gray;">Loading</b>:')
+        self.name_field = QtWidgets.QLineEdit(self.path)
+        self.name_field.setReadOnly(True)
+        self.progress_bar = QtWidgets.QProgressBar()
+        self.progress_bar.setMaximumWidth(120)
+        self.progress_bar.hide()
+        self.cancel_btn = custom_widget.GraphicButton(get_path('close.png', icon=True), self.onCancel, size=(18,18))
+        self.cancel_btn.setToolTip('cancel loading')
+
+        self.main_layout.addWidget(self.loading_lbl)
+        self.main_layout.addWidget(self.name_field)
+        self.main_layout.addWidget(self.progress_bar)
+        self.main_layout.addWidget(self.cancel_btn)
+
+    def set_progress(self, percent):
+        self.progress_bar.show()
+        self.progress_bar.setValue(percent)
+
+    def onCancel(self, event):
+        self.browser.cancel_loading(self.path)
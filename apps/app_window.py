@@ -34,6 +34,9 @@ class EZMWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         self.main_widget.project_browser.onModified()
+        self.main_widget.project_browser.merge_storage()
+        self.main_widget.project_browser.save_scheduler.flush()  # make sure background save finished before exit
+        self.main_widget.project_browser.update_snapshot_cache()
         # check if calendar_editor has any unsaved
         if self.main_widget.calendar_editor.is_modified:
             warning = QtWidgets.QMessageBox.warning(self,
@@ -12,39 +12,28 @@ import shutil
 class cmd_addAsset(QtGui.QUndoCommand):
     desc = 'add asset'
 
-    def __init__(self, project, asset_scroll, files, group):
+    def __init__(self, project, asset_scroll, assets):
+        """assets is created by import (EZMAssetImport), command only add and remove them"""
         super().__init__(self.desc)
 
         self.project = project
         self.asset_scroll = asset_scroll
-        self.files = files
-        self.group = group
+        self.assets = assets
         
         self.scroll_container = self.asset_scroll.asset_container
-        self.assets_name = [asset.name for asset in self.project.asset]
-
-        self.created_asset = [] # hold the asset data if created, for undo
 
     def redo(self):
-        for file in self.files:
-            # create asset 
-            name = check_duplicate_str(os.path.splitext(os.path.basename(file))[0], self.assets_name)
-            info = QtCore.QFileInfo(file)
-            last_modified = QtCore.QDateTime(info.lastModified()).toString('dd/MM/yyyy HH:mm')
-            file_type = os.path.splitext(file)[1].lower()[1:]
-            new_asset = EZMAssetItem(self.project, self.asset_scroll, name, file, self.group, last_modified, file_type, 0)
-            
-            # add new asset to project and show
-            self.scroll_container.add_item(new_asset)
-            self.project.add_asset(new_asset)
-            self.created_asset.append(new_asset) 
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            self.scroll_container.add_items(self.assets)    # single model insert
+            for asset in self.assets:
+                self.project.add_asset(asset)
+            self.asset_scroll.onModified()
 
     def undo(self):
-        self.project.remove_asset(self.created_asset)
-        self.scroll_container.remove_item(self.created_asset)
-        self.asset_scroll.onModified()  # trigger to save changes
-        self.created_asset = [] # clear created asset again to inital state
+        with self.asset_scroll.batch():
+            self.project.remove_asset(self.assets)
+            self.scroll_container.remove_item(self.assets)
+            self.asset_scroll.onModified()  # trigger to save changes
 
 class cmd_deleteAsset(QtGui.QUndoCommand):
     desc = 'delete asset'
@@ -58,19 +47,21 @@ class cmd_deleteAsset(QtGui.QUndoCommand):
         self.scroll_container = self.asset_scroll.asset_container
 
     def redo(self):
-        self.scroll_container.remove_item(self.selection)
-        self.project.remove_asset(self.selection)
-        self.asset_scroll.onModified()
-        for asset in self.selection:
-            asset.loadAssignment()  # update to assignment if available
+        with self.asset_scroll.batch():
+            self.scroll_container.remove_item(self.selection)
+            self.project.remove_asset(self.selection)
+            self.asset_scroll.onModified()
+            for asset in self.selection:
+                asset.loadAssignment()  # update to assignment if available
 
     def undo(self):
-        for asset in self.selection:
-            self.scroll_container.add_item(asset)
-            self.project.add_asset(asset)
-            asset.loadAssignment()  # update to assignment if available
-        self.scroll_container.reset_selection(self.selection)   # retrieve selection before deletion
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for asset in self.selection:
+                self.scroll_container.add_item(asset)
+                self.project.add_asset(asset)
+                asset.loadAssignment()  # update to assignment if available
+            self.scroll_container.reset_selection(self.selection)   # retrieve selection before deletion
+            self.asset_scroll.onModified()
 
 class cmd_renameAsset(QtGui.QUndoCommand):
     desc = 'rename asset'
@@ -85,14 +76,12 @@ class cmd_renameAsset(QtGui.QUndoCommand):
 
     def redo(self):
         self.asset.name = self.name_after
-        self.asset.name_lbl.update_text(self.name_after)    # do this to make sure name still match if user do, undo and redo again 
-        self.asset.asset_scroll.onModified()    # also update asset detail here
+        self.asset.asset_scroll.onModified([self.asset])    # also update asset detail here
         self.asset.loadAssignment()
 
     def undo(self):
         self.asset.name = self.name_before
-        self.asset.name_lbl.update_text(self.name_before) 
-        self.asset.asset_scroll.onModified()    # also update asset detail here
+        self.asset.asset_scroll.onModified([self.asset])    # also update asset detail here
         self.asset.loadAssignment()
 
 class cmd_updateAsset(QtGui.QUndoCommand):
@@ -116,16 +105,17 @@ class cmd_updateAsset(QtGui.QUndoCommand):
         self.asset.date_modified = last_modified
         file_type = os.path.splitext(self.file)[1].lower()[1:]
         self.asset.type = file_type
-        self.asset_scroll.onModified()
+        self.asset_scroll.onModified([self.asset])
 
     def undo(self):
         self.asset.path = self.prev_path
         self.asset.date_modified = self.prev_date
         self.asset.type = self.prev_type
-        self.asset_scroll.onModified()
+        self.asset_scroll.onModified([self.asset])
 
 class cmd_setAssetStatus(QtGui.QUndoCommand):
     desc = 'set asset status'
+    merge_id = 1
 
     def __init__(self, asset_scroll, assets, status):
         super().__init__(self.desc)
@@ -136,17 +126,28 @@ class cmd_setAssetStatus(QtGui.QUndoCommand):
 
         self.assets_status = [asset.status for asset in self.assets] # save all status data from order selection
 
+    def id(self):
+        return self.merge_id
+
+    def mergeWith(self, other):
+        """setting status again on the same selection is one undo step, keep first previous status"""
+        if set(other.assets) != set(self.assets): return False
+        self.status = other.status
+        return True
+
     def redo(self):
-        for asset in self.assets:
-            asset.status = self.status
-            asset.loadAssignment()
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for asset in self.assets:
+                asset.status = self.status
+                asset.loadAssignment()
+            self.asset_scroll.onModified(self.assets)
 
     def undo(self):
-        for index, asset in enumerate(self.assets):
-            asset.status = self.assets_status[index]
-            asset.loadAssignment()
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for index, asset in enumerate(self.assets):
+                asset.status = self.assets_status[index]
+                asset.loadAssignment()
+            self.asset_scroll.onModified(self.assets)
 
 class cmd_createPlaceholder(QtGui.QUndoCommand):
     desc = 'create placeholder asset'
@@ -258,6 +259,7 @@ class cmd_publishAsset(QtGui.QUndoCommand):
 
 class cmd_setAssignmentDate(QtGui.QUndoCommand):
     desc = 'set assignment date'
+    merge_id = 2
 
     def __init__(self, asset_scroll, assets, date):
         super().__init__(self.desc)
@@ -267,19 +269,30 @@ class cmd_setAssignmentDate(QtGui.QUndoCommand):
 
         self.prev_assignment_dates = [asset.date_assignment for asset in self.assets]
 
+    def id(self):
+        return self.merge_id
+
+    def mergeWith(self, other):
+        """setting date again on the same selection is one undo step, keep first previous date"""
+        if set(other.assets) != set(self.assets): return False
+        self.date = other.date
+        return True
+
     def redo(self):
-        for asset in self.assets:
-            asset.date_assignment = self.date
-            asset.loadAssignment() # update to checklist class
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for asset in self.assets:
+                asset.date_assignment = self.date
+                asset.loadAssignment() # update to checklist class
+            self.asset_scroll.onModified(self.assets)
         
     def undo(self):
-        for index, asset in enumerate(self.assets):
-            asset.date_assignment = self.prev_assignment_dates[index]
-            if asset.date_assignment == []: 
-                asset.remove_asset_assignment_from_calendar()
-            asset.loadAssignment() # update to checklist class
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for index, asset in enumerate(self.assets):
+                asset.date_assignment = self.prev_assignment_dates[index]
+                if asset.date_assignment == []: 
+                    asset.remove_asset_assignment_from_calendar()
+                asset.loadAssignment() # update to checklist class
+            self.asset_scroll.onModified(self.assets)
 
 class cmd_removeAssignmentDate(QtGui.QUndoCommand):
     desc = 'remove assignment date'
@@ -292,16 +305,18 @@ class cmd_removeAssignmentDate(QtGui.QUndoCommand):
         self.prev_assignment_dates = [asset.date_assignment for asset in self.assets]
 
     def redo(self):
-        for asset in self.assets:
-            asset.date_assignment = []
-            asset.remove_asset_assignment_from_calendar()
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for asset in self.assets:
+                asset.date_assignment = []
+                asset.remove_asset_assignment_from_calendar()
+            self.asset_scroll.onModified(self.assets)
 
     def undo(self):
-        for index, asset in enumerate(self.assets):
-            asset.date_assignment = self.prev_assignment_dates[index]
-            asset.loadAssignment() # update to checklist class
-        self.asset_scroll.onModified()
+        with self.asset_scroll.batch():
+            for index, asset in enumerate(self.assets):
+                asset.date_assignment = self.prev_assignment_dates[index]
+                asset.loadAssignment() # update to checklist class
+            self.asset_scroll.onModified(self.assets)
 
 """
 
@@ -0,0 +1,331 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+import os
+import sys
+
+# pure python data for project and asset, no Qt involved. widget (EZMProjectItem, EZMAssetItem...) only act as view over these record,
+# so loading, sorting, filtering and saving can run without building any widget
+
+DATE_FORMAT = "%d/%m/%Y %H:%M"
+NO_DATE = '01/01/9999 00:00'   # date of placeholder asset
+EPOCH = datetime(1970, 1, 1)
+
+def parse_date(text):
+    """convert 'dd/mm/yyyy HH:MM' to integer second from epoch (naive time, no timezone shift so it's safe for year 9999)"""
+    if isinstance(text, int): return text
+    try:
+        return int((datetime.strptime(text, DATE_FORMAT) - EPOCH).total_seconds())
+    except (TypeError, ValueError):
+        print("WARNING: invalid date '%s', saved as no date (%s) instead"%(text, NO_DATE))
+        return parse_date(NO_DATE)  # shown as N/A, never mistaken for a real date
+
+def format_date(value):
+    """convert integer second from epoch back to 'dd/mm/yyyy HH:MM'"""
+    return (EPOCH + timedelta(seconds=value)).strftime(DATE_FORMAT)
+
+def timestamp_date(timestamp):
+    """file modified time from os.stat as integer date (local time, minute precision like saved text)"""
+    return int((datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) - EPOCH).total_seconds())
+
+def intern(text):
+    """share the same string object for repeated value like group and type"""
+    if isinstance(text, str): return sys.intern(text)
+    return text
+
+def path_key(path):
+    """normalized, case-folded absolute path, same file written differently give the same key"""
+    return os.path.normcase(os.path.abspath(path)).casefold()
+
+def record_property(name):
+    """property for view class that read and write attribute of its record, writing mark the record as changed"""
+    def setter(self, value):
+        setattr(self.record, name, value)
+        self.record.touch()
+    return property(lambda self: getattr(self.record, name), setter)
+
+class VersionRecord(object):
+    __slots__ = ('name', 'path', 'group', 'date_modified', 'type', 'status')
+
+    def __init__(self, name, path, group, date_modified, type, status):
+        self.name = name
+        self.path = path
+        self.group = intern(group)
+        self.date_modified = parse_date(date_modified)
+        self.type = intern(type)
+        self.status = status
+
+    def touch(self):
+        """version only change through its struct (add/remove version), struct record take care the revision"""
+
+    def to_dict(self):
+        return OrderedDict([('name', self.name),
+                            ('path', self.path),
+                            ('group', self.group),
+                            ('date_modified', format_date(self.date_modified)),
+                            ('type', self.type),
+                            ('status', self.status)])
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'], data['path'], data['group'], data['date_modified'], data['type'], data['status'])
+
+    def to_row(self):
+        """plain tuple for binary cache, date stay as integer"""
+        return (self.name, self.path, self.group, self.date_modified, self.type, self.status)
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+class AssetRecord(object):
+    __slots__ = ('name', 'path', 'group', 'date_modified', 'type', 'status', 'date_assignment', 'preview', 'notes', 'revision', '_cache', '_keys', 'uid')
+
+    def __init__(self, name, path, group, date_modified, type, status, date_assignment=None, preview='', notes=''):
+        """ status { 0:unchecked ; 1:checked ; 2:verified }, date_assignment [start date, due date] or empty"""
+        self.name = name
+        self.path = path
+        self.group = intern(group)
+        self.date_modified = parse_date(date_modified)
+        self.type = intern(type)
+        self.status = status
+        self.date_assignment = date_assignment if date_assignment is not None else []
+        self.preview = preview
+        self.notes = notes
+        self.revision = 0   # increased on every change, serialized dict is reused while it stays the same
+        self._cache = None  # (revision, dict)
+        self._keys = None   # (revision, sort key...)
+        self.uid = None     # id inside project used by journal, follow order in saved snapshot
+
+    def touch(self):
+        self.revision += 1
+
+    def cached_dict(self):
+        """dict of unchanged record is reused, only changed asset get serialized again when project saved"""
+        cache = self._cache
+        if cache is None or cache[0] != self.revision:
+            revision = self.revision    # read first, change made while building will rebuild next time
+            cache = (revision, self.to_dict())
+            self._cache = cache
+        return cache[1]
+
+    def sort_keys(self):
+        """(revision, lowercase name, lowercase type, date modified), computed again only after record changed"""
+        keys = self._keys
+        if keys is None or keys[0] != self.revision:
+            keys = (self.revision, self.name.lower(), self.type.lower(), self.date_modified)
+            self._keys = keys
+        return keys
+
+    def to_dict(self):
+        return OrderedDict([('name', self.name),
+                            ('path', self.path),
+                            ('group', self.group),
+                            ('date_modified', format_date(self.date_modified)),
+                            ('type', self.type),
+                            ('status', self.status),
+                            ('date_assignment', self.date_assignment),
+                            ('preview', self.preview),
+                            ('notes', self.notes)])
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'],
+                   data['path'],
+                   data['group'],
+                   data['date_modified'],
+                   data['type'],
+                   data['status'],
+                   data['date_assignment'],
+                   data['preview'],
+                   data['notes'])
+
+    def to_row(self):
+        """plain tuple for binary cache, date stay as integer"""
+        return (self.name, self.path, self.group, self.date_modified, self.type, self.status, self.date_assignment, self.preview, self.notes)
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+class StructRecord(AssetRecord):
+    __slots__ = ('file', 'file_version')
+
+    def __init__(self, name, path, group, date_modified, type, status, file, date_assignment=None, preview='', notes='', file_version=None):
+        super().__init__(name, path, group, date_modified, type, status, date_assignment, preview, notes)
+        self.file = file
+        self.file_version = file_version if file_version is not None else []   # list of VersionRecord
+
+    def to_dict(self):
+        return OrderedDict([('name', self.name),
+                            ('path', self.path),
+                            ('group', self.group),
+                            ('date_modified', format_date(self.date_modified)),
+                            ('type', self.type),
+                            ('status', self.status),
+                            ('file', self.file),
+                            ('date_assignment', self.date_assignment),
+                            ('preview', self.preview),
+                            ('file_version', [version.to_dict() for version in self.file_version]),
+                            ('notes', self.notes)])
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['name'],
+                   data['path'],
+                   data['group'],
+                   data['date_modified'],
+                   data['type'],
+                   data['status'],
+                   data['file'],
+                   data['date_assignment'],
+                   data['preview'],
+                   data['notes'],
+                   [VersionRecord.from_dict(version) for version in data['file_version']])
+
+    def to_row(self):
+        return super().to_row() + (self.file, [version.to_row() for version in self.file_version])
+
+    @classmethod
+    def from_row(cls, row):
+        name, path, group, date_modified, type, status, date_assignment, preview, notes, file, file_version = row
+        return cls(name, path, group, date_modified, type, status, file, date_assignment, preview, notes, [VersionRecord.from_row(version) for version in file_version])
+
+def asset_paths(record):
+    """every path owned by asset: its path, and for struct the folder, file and version file"""
+    paths = [record.path]
+    if type(record) is StructRecord:
+        paths.append(record.file)
+        paths.extend(version.path for version in record.file_version)
+    return [path for path in paths if path]  # placeholder has no path
+
+class ProjectRecord(object):
+    __slots__ = ('name', 'category', 'path', 'thumbnail', '_asset', '_loader', 'dirty', 'next_uid', '_path_index')
+
+    def __init__(self, name='project_template', category='Other', path='', thumbnail='', asset=None, loader=None):
+        self.name = name
+        self.category = intern(category)
+        self.path = path
+        self.thumbnail = thumbnail
+        self._asset = asset if asset is not None else []   # AssetRecord and StructRecord in display order
+        self._loader = loader   # project read from database only hold assigned asset, the rest is read on first access
+        self.dirty = False  # changed since last save
+        self.next_uid = 0
+        self._path_index = None # path_key : list of asset record owning the path, built on first lookup
+
+    @property
+    def asset(self):
+        if self._loader: self.load_asset()
+        return self._asset
+
+    @asset.setter
+    def asset(self, asset):
+        self._asset = asset
+        self._loader = None
+
+    def load_asset(self):
+        loader, self._loader = self._loader, None
+        if loader: self._asset = loader(self._asset)
+
+    def is_loaded(self):
+        return self._loader is None
+
+    def loaded_asset(self):
+        """asset read so far, without reading the rest"""
+        return self._asset
+
+    def memory_size(self):
+        """rough byte size of record and its asset read so far"""
+        size = sys.getsizeof(self)
+        for record in self.loaded_asset():
+            size += sys.getsizeof(record) + sum(sys.getsizeof(text) for text in (record.name, record.path, record.preview, record.notes))
+            if type(record) is StructRecord:
+                size += sum(sys.getsizeof(version) + sys.getsizeof(version.name) + sys.getsizeof(version.path) for version in record.file_version)
+        return size
+
+    def path_index(self):
+        if self._path_index is None:
+            self._path_index = {}
+            for record in self.asset: self.index_asset(record)
+        return self._path_index
+
+    def index_asset(self, record):
+        """add path of record to index, call after asset is added or its path changed"""
+        if self._path_index is None: return # everything is indexed on first lookup
+        for path in asset_paths(record):
+            owners = self._path_index.setdefault(path_key(path), [])
+            if record not in owners: owners.append(record)
+
+    def unindex_asset(self, record):
+        """remove path of record from index, return True if record was indexed"""
+        if self._path_index is None: return False
+        found = False
+        for path in asset_paths(record):
+            key = path_key(path)
+            owners = self._path_index.get(key, [])
+            if record in owners:
+                owners.remove(record)
+                found = True
+            if not owners: self._path_index.pop(key, None)
+        return found
+
+    def find_asset(self, path, exclude=[]):
+        """asset record owning path (asset path, struct folder, struct file or version file), None if not found"""
+        for record in self.path_index().get(path_key(path), []):
+            if record not in exclude: return record
+        return None
+
+    def add_asset(self, record):
+        self.asset.append(record)
+        self.index_asset(record)
+
+    def assigned_asset(self):
+        """asset with start and due date, available without reading every asset"""
+        return [record for record in self.loaded_asset() if len(record.date_assignment) == 2]
+
+    def content_stamp(self):
+        """header, asset order and revision, equal stamp means the record content didn't change in between"""
+        return tuple(self.header().values()), [(id(record), record.revision) for record in self.loaded_asset()]
+
+    def header(self):
+        return OrderedDict([('name', self.name),
+                            ('category', self.category),
+                            ('path', self.path),
+                            ('thumbnail', self.thumbnail)])
+
+    def to_dict(self, asset=None):
+        asset_list = []
+        struct_list = []
+        for asset in (self.asset if asset is None else asset):
+            if type(asset) is AssetRecord: # using type rather than isinstance to ignore inheritance
+                asset_list.append(asset.cached_dict())
+            elif type(asset) is StructRecord:
+                struct_list.append(asset.cached_dict())
+
+        return OrderedDict([('name', self.name),
+                            ('category', self.category),
+                            ('path', self.path),
+                            ('thumbnail', self.thumbnail),
+                            ('asset', asset_list),
+                            ('struct', struct_list)])
+
+    @classmethod
+    def from_dict(cls, data):
+        asset = [AssetRecord.from_dict(asset_data) for asset_data in data['asset']]
+        asset += [StructRecord.from_dict(struct_data) for struct_data in data['struct']]
+        return cls.from_parts(data, asset)
+
+    @classmethod
+    def from_parts(cls, header, asset):
+        """project from header dict and record already built (asset first then struct)"""
+        project = cls(header['name'], header['category'], header['path'], header['thumbnail'], asset)
+        project.number_asset()
+        return project
+
+    def number_asset(self, asset=None):
+        """give uid following snapshot order (asset first then struct), same numbering as loading the snapshot again"""
+        asset = self.asset if asset is None else asset
+        ordered = [record for record in asset if type(record) is AssetRecord] + [record for record in asset if type(record) is StructRecord]
+        for uid, record in enumerate(ordered): record.uid = uid
+        self.next_uid = len(ordered)
+        return ordered
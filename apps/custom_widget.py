@@ -21,10 +21,7 @@ class GraphicButton(QtWidgets.QLabel):
         self.initUI()
 
     def initUI(self):
-        self.item_image = validate_image_path(self.icon, backup=get_path("python.png", icon=True))
-        self.item_image = self.item_image.scaled(self.icon_size[0],self.icon_size[1],QtCore.Qt.IgnoreAspectRatio,QtCore.Qt.SmoothTransformation)
-        self.item_pixmap = QtGui.QPixmap()
-        self.item_pixmap.convertFromImage(self.item_image)
+        self.item_pixmap = icon_cache.pixmap(self.icon, self.icon_size, QtCore.Qt.IgnoreAspectRatio, backup=get_path("python.png", icon=True))
         self.setPixmap(self.item_pixmap)
 
         # set highlight mouse hover effect
@@ -35,9 +32,7 @@ class GraphicButton(QtWidgets.QLabel):
 
     def change_icon(self, path):
         self.icon = path
-        self.item_image = validate_image_path(self.icon)
-        self.item_image = self.item_image.scaled(self.icon_size[0],self.icon_size[1],QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation)
-        self.item_pixmap.convertFromImage(self.item_image)
+        self.item_pixmap = icon_cache.pixmap(self.icon, self.icon_size)
         self.setPixmap(self.item_pixmap)
 
     def mousePressEvent(self, event):
@@ -64,18 +59,20 @@ class GraphicLabel(QtWidgets.QLabel):
         self.initUI()
 
     def initUI(self):
-        self.item_image = validate_image_path(self.icon)
-        self.item_image = self.item_image.scaled(self.icon_size[0],self.icon_size[1],QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation)
-        self.item_pixmap = QtGui.QPixmap()
-        self.item_pixmap.convertFromImage(self.item_image)
+        self.item_pixmap = icon_cache.pixmap(self.icon, self.icon_size)  # shared with every label showing the same icon
         self.setPixmap(self.item_pixmap)
     
     def change_icon(self, path, icon=None):
         self.icon = path
-        self.item_image = validate_image_path(self.icon)
         if icon: self.icon_size = icon
-        self.item_image = self.item_image.scaled(self.icon_size[0],self.icon_size[1],QtCore.Qt.KeepAspectRatio,QtCore.Qt.SmoothTransformation)
-        self.item_pixmap.convertFromImage(self.item_image)
+        self.item_pixmap = icon_cache.pixmap(self.icon, self.icon_size)
+        self.setPixmap(self.item_pixmap)
+
+    def change_pixmap(self, path, pixmap):
+        """show pixmap decoded elsewhere (preview loaded on worker)"""
+        self.icon = path
+        self.icon_size = (pixmap.width(), pixmap.height())
+        self.item_pixmap = pixmap
         self.setPixmap(self.item_pixmap)
 
 class ValidableGraphicLabel(GraphicLabel):
@@ -259,6 +256,22 @@ class InteractiveItemContainer(QtWidgets.QWidget):
     def get_all_item(self):
         return [self.main_layout.itemAt(i).widget() for i in range(self.main_layout.count())]
 
+    def reorder(self, items):
+        """put item in given order (same widget already inside container) with a single relayout at the end"""
+        current = self.get_all_item()
+        first = 0   # item before first out of place one stay in layout
+        while first < len(items) and first < len(current) and items[first] is current[first]: first += 1
+        if first == len(items) == len(current): return
+        self.setUpdatesEnabled(False)
+        self.main_layout.setEnabled(False)  # insertWidget would relayout on every move
+        try:
+            while self.main_layout.count() > first: self.main_layout.takeAt(self.main_layout.count()-1)   # widget keep its parent, only layout item is dropped
+            for item in items[first:]: self.main_layout.addWidget(item)
+        finally:
+            self.main_layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+        self.main_layout.activate()
+
     def add_item(self, instance):
         """helper function to add item that doesnt have container"""
         instance.container = self   # automaticlly add widget to container main layout
@@ -335,8 +348,7 @@ class InteractiveItem(QtWidgets.QFrame):
     def __init__(self, container=None): 
         super().__init__()
 
-        self.setObjectName('selectiveFrame')
-        self.setStyleSheet('InteractiveItem#selectiveFrame{border: 1px solid #101010}')
+        self.setObjectName('selectiveFrame')    # border follow 'state' property, see dark.qss
 
 
         self._selected = False # use for highlight asset and trigger details tab
@@ -419,12 +431,10 @@ class InteractiveItem(QtWidgets.QFrame):
             self.selected = False
 
     def paintBorder(self):
-        if self.selected:
-            self.setStyleSheet('InteractiveItem#selectiveFrame{border: 1px solid #FFA500}')
-        elif self.hovered:
-            self.setStyleSheet('InteractiveItem#selectiveFrame{border: 1px solid #1363bf}')
-        else:
-            self.setStyleSheet('InteractiveItem#selectiveFrame{border: 1px solid #101010}')
+        if self.selected: state = 'selected'
+        elif self.hovered: state = 'hovered'
+        else: state = ''
+        set_style_property(self, 'state', state)
 
 class ExpandableWidget(QtWidgets.QWidget):
     def __init__(self, parent=None):
@@ -0,0 +1,924 @@
+from collections import OrderedDict
+from PySide6 import QtCore, QtGui
+
+from concurrent.futures import ThreadPoolExecutor
+from core import AssetRecord, StructRecord, VersionRecord, ProjectRecord, timestamp_date
+from datetime import datetime
+from functools import partial
+from util import file_status, icon_cache
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+
+DEBUG = True
+
+SAVE_DELAY = 500    # default quiet period (ms) before scheduled save is written
+LOAD_WORKERS = 32   # project file read at the same time, reading mostly wait on disk so thread is cheap
+STREAM_SIZE = 16*1024*1024  # project file bigger than this (byte) is parsed record by record
+STREAM_CHUNK = 1024*1024
+CACHE_VERSION = 1   # increase when cached row layout change, older cache is ignored
+SCAN_WORKERS = 8    # dropped file and folder listed at the same time
+SCAN_CHUNK = 500    # dropped path handled by one worker job
+VALIDATE_WORKERS = 8    # folder listed at the same time while validating asset path
+WATCH_DELAY = 300   # quiet period (ms) before changed folder is reported
+WATCH_LIMIT = 2048  # folder watched by the os at most, the rest is polled
+POLL_INTERVAL = 10000   # ms between poll of folder that can't be watched
+POLL_BATCH = 100    # folder polled per interval
+THUMBNAIL_WORKERS = 2   # preview decoded at the same time
+THUMBNAIL_FOLDER = '.thumbnail' # downscaled preview kept next to its screenshot
+
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_COMPACT_SIZE = 1024*1024    # journal bigger than this (byte) is merged into snapshot
+JOURNAL_COMPACT_TIME = 600  # or older than this (second)
+
+STORE_VERSION = 1   # increase with a step in STORE_MIGRATION when table or index of existing database change
+STORE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project (id INTEGER PRIMARY KEY, file TEXT UNIQUE NOT NULL, snapshot TEXT, name TEXT, category TEXT, path TEXT, thumbnail TEXT,
+                                    changed INTEGER NOT NULL DEFAULT 0);
+CREATE TABLE IF NOT EXISTS asset (project INTEGER NOT NULL, uid INTEGER NOT NULL, position INTEGER, name TEXT, path TEXT, asset_group TEXT, date_modified INTEGER,
+                                  type TEXT, status INTEGER, date_assignment TEXT, due INTEGER, preview TEXT, notes TEXT, PRIMARY KEY (project, uid));
+CREATE TABLE IF NOT EXISTS struct (project INTEGER NOT NULL, uid INTEGER NOT NULL, file TEXT, PRIMARY KEY (project, uid));
+CREATE TABLE IF NOT EXISTS version (project INTEGER NOT NULL, uid INTEGER NOT NULL, position INTEGER, name TEXT, path TEXT, asset_group TEXT, date_modified INTEGER, type TEXT, status INTEGER);
+CREATE INDEX IF NOT EXISTS asset_group ON asset (project, asset_group, position);
+CREATE INDEX IF NOT EXISTS asset_name ON asset (project, name COLLATE NOCASE, position);
+CREATE INDEX IF NOT EXISTS asset_type ON asset (project, type COLLATE NOCASE, position);
+CREATE INDEX IF NOT EXISTS asset_date ON asset (project, date_modified DESC, position);
+CREATE INDEX IF NOT EXISTS asset_due ON asset (project, due);
+CREATE INDEX IF NOT EXISTS version_asset ON version (project, uid);
+"""
+# run once on database older than the version, before STORE_SCHEMA
+STORE_MIGRATION = {
+    # database change not exported yet is unknown, export every project once
+    1: """
+DROP INDEX IF EXISTS asset_path;
+DROP INDEX IF EXISTS asset_group;
+DROP INDEX IF EXISTS asset_status;
+ALTER TABLE project ADD COLUMN changed INTEGER NOT NULL DEFAULT 1;
+"""}
+STORE_SORT = {'Name': 'name COLLATE NOCASE', 'Type': 'type COLLATE NOCASE', 'Last Updated': 'date_modified DESC'}  # asset sorter : indexed column
+
+def write_json_atomic(path, data):
+    write_file_atomic(path, json.dumps(data, indent=4))
+
+def write_file_atomic(path, data):
+    """write text or bytes to temporary file next to target then rename it, so crash never leave half written file"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix='.%s.'%os.path.basename(path), suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb' if isinstance(data, bytes) else 'w') as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        if os.path.exists(path): shutil.copymode(path, temp_path)  # keep permission of original file
+        os.replace(temp_path, path)
+    except:
+        if os.path.exists(temp_path): os.remove(temp_path)
+        raise
+
+class LoadCanceled(Exception):
+    """raised inside loader thread when user cancel loading project"""
+
+def read_project_file(path, progress=None, canceled=None):
+    """read project json to ProjectRecord, big file is streamed so its whole text is never held in memory"""
+    if os.path.getsize(path) < STREAM_SIZE:
+        with open(path, 'r') as file:
+            return ProjectRecord.from_dict(json.loads(file.read()))
+    return ProjectStreamReader(path, progress, canceled).read()
+
+class SnapshotCache(object):
+    """
+    parsed project kept as pickled row tuple (date as integer) under data/cache, valid while project json keep the same size and mtime.
+    warm start read it instead of parsing json and converting date string
+    """
+    def __init__(self, directory):
+        self.directory = directory
+        self.snapshots = {} # project file : json snapshot matching its cache
+
+    def cache_path(self, file):
+        return os.path.join(self.directory, hashlib.sha1(os.path.abspath(file).encode('utf-8')).hexdigest() + '.cache')
+
+    def snapshot_id(self, file):
+        info = os.stat(file)
+        return (info.st_size, info.st_mtime_ns)
+
+    def load(self, file):
+        """ProjectRecord from cache, None if cache is missing or outdated"""
+        cache_path = self.cache_path(file)
+        if not os.path.exists(cache_path): return None
+        try:
+            with open(cache_path, 'rb') as cache_file:
+                version, cache_for, snapshot, header, asset, struct = pickle.load(cache_file)
+        except Exception as e:
+            print('WARNING: ignore broken cache %s: %s'%(cache_path, e))
+            return None
+        if version != CACHE_VERSION or cache_for != file or snapshot != self.snapshot_id(file): return None
+        records = [AssetRecord.from_row(row) for row in asset] + [StructRecord.from_row(row) for row in struct]
+        self.snapshots[file] = snapshot
+        if DEBUG: print('project read from cache > %s'%file)
+        return ProjectRecord.from_parts(dict(zip(('name', 'category', 'path', 'thumbnail'), header)), records)
+
+    def store(self, file, project, snapshot=None):
+        """cache project record, it must have the same content as project json (snapshot taken before json was read)"""
+        try:
+            snapshot = snapshot or self.snapshot_id(file)
+            asset = [record.to_row() for record in project.asset if type(record) is AssetRecord]
+            struct = [record.to_row() for record in project.asset if type(record) is StructRecord]
+            data = (CACHE_VERSION, file, snapshot, tuple(project.header().values()), asset, struct)
+            os.makedirs(self.directory, exist_ok=True)
+            write_file_atomic(self.cache_path(file), pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+            self.snapshots[file] = snapshot
+        except Exception as e: print("WARNING: can't cache %s: %s"%(file, e))
+
+    def is_current(self, file):
+        return os.path.exists(file) and self.snapshots.get(file) == self.snapshot_id(file)
+
+    def prune(self, files):
+        """remove cache of project no longer opened"""
+        if not os.path.exists(self.directory): return
+        keep = set(os.path.basename(self.cache_path(file)) for file in files)
+        for name in os.listdir(self.directory):
+            if name.endswith('.cache') and name not in keep: os.remove(os.path.join(self.directory, name))
+
+class ProjectStreamReader(object):
+    """
+    parse project json incrementally, asset and struct array is decoded one record at a time with raw_decode so
+    only current chunk and built record stay in memory. progress get percent of file read, canceled is polled every chunk
+    """
+    def __init__(self, path, progress=None, canceled=None):
+        self.path = path
+        self.progress = progress
+        self.canceled = canceled
+        self.size = max(os.path.getsize(path), 1)
+
+        self.decoder = json.JSONDecoder()
+        self.file = None
+        self.buffer = ''
+        self.index = 0  # read position inside buffer
+        self.eof = False
+
+    def read(self):
+        header = {}
+        record_class = {'asset': AssetRecord, 'struct': StructRecord}
+        records = {'asset': [], 'struct': []}
+        with open(self.path, 'r') as self.file:
+            self.expect('{')
+            if not self.skip('}'):
+                while True:
+                    key = self.decode()
+                    self.expect(':')
+                    if key in record_class: records[key] = [record_class[key].from_dict(data) for data in self.iter_array()]
+                    else: header[key] = self.decode()
+                    if self.expect(',}') == '}': break
+            self.skip_space()
+            if self.index < len(self.buffer): raise ValueError('extra data after project in %s'%self.path)
+        if DEBUG: print('project streamed > %s'%self.path)
+        return ProjectRecord.from_parts(header, records['asset'] + records['struct'])
+
+    def iter_array(self):
+        self.expect('[')
+        if self.skip(']'): return
+        while True:
+            yield self.decode()
+            if self.expect(',]') == ']': return
+
+    def fill(self):
+        """read next chunk and drop text already parsed, False at end of file"""
+        if self.eof: return False
+        if self.canceled and self.canceled(): raise LoadCanceled(self.path)
+        chunk = self.file.read(STREAM_CHUNK)
+        self.buffer = self.buffer[self.index:] + chunk
+        self.index = 0
+        self.eof = not chunk
+        if self.progress: self.progress(min(int(self.file.buffer.tell()*100/self.size), 100))
+        return not self.eof
+
+    def skip_space(self):
+        while True:
+            while self.index < len(self.buffer) and self.buffer[self.index] in ' \t\n\r': self.index += 1
+            if self.index < len(self.buffer) or not self.fill(): return
+
+    def skip(self, character):
+        """consume character if it's next"""
+        self.skip_space()
+        if self.buffer[self.index:self.index+1] != character: return False
+        self.index += 1
+        return True
+
+    def expect(self, characters):
+        self.skip_space()
+        character = self.buffer[self.index:self.index+1]
+        if not character or character not in characters: raise ValueError('expecting %s at %s'%(' or '.join(characters), self.path))
+        self.index += 1
+        return character
+
+    def decode(self):
+        self.skip_space()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.index)
+                if end < len(self.buffer) or self.eof:    # number at the end of buffer might continue in next chunk
+                    self.index = end
+                    return value
+            except ValueError:
+                if self.eof: raise
+            self.fill()
+
+class SaveScheduler(object):
+    """
+    merge burst of save request into one write after quiet period, serialization and writing run on worker thread.
+    job must be Qt free (record only), any change made while writing schedule another save so last write always win
+    """
+    def __init__(self, delay=SAVE_DELAY):
+        self.delay = delay
+
+        self._pending = OrderedDict()   # key (project path) : job, waiting for quiet period
+        self._queue = OrderedDict()     # key : job, ready for worker
+        self._busy = False
+        self._running = None    # key of job being written
+        self._condition = threading.Condition()
+
+        self._timer = QtCore.QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.release)
+
+        self._thread = threading.Thread(target=self.run, name='EZMSaveScheduler', daemon=True)
+        self._thread.start()
+
+    def schedule(self, key, job):
+        """request save, restart quiet period. only latest job of same key run once per burst"""
+        self._pending.pop(key, None)
+        self._pending[key] = job
+        self._timer.start(max(self.delay, 0))
+
+    def release(self):
+        """hand pending save to worker thread"""
+        self._timer.stop()
+        if not self._pending: return
+        with self._condition:
+            for key, job in self._pending.items():
+                self._queue.pop(key, None) # move to the back, so order follow latest request
+                self._queue[key] = job
+            self._pending.clear()
+            self._condition.notify_all()
+
+    def is_pending(self, key):
+        """True while save of key is waiting or being written"""
+        with self._condition:
+            return key in self._pending or key in self._queue or self._running == key
+
+    def flush(self):
+        """write everything now and wait until worker done, call before app closed"""
+        self.release()
+        with self._condition:
+            while self._queue or self._busy:
+                self._condition.wait()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+                key, job = self._queue.popitem(last=False)
+                self._busy = True
+                self._running = key
+            try:
+                job()
+                if DEBUG: print('saved > %s'%key)
+            except Exception as e: print("WARNING: can't save %s: %s"%(key, e))
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._running = None
+                    self._condition.notify_all()
+
+class ProjectLoader(QtCore.QObject):
+    """
+    read project file on worker threads, so startup on slow disk or network share take as long as the slowest file.
+    result is applied on GUI thread in requested order, read function must not touch any widget
+    """
+    arrived = QtCore.Signal(str, object)    # emitted from worker, queued to GUI thread
+    progress = QtCore.Signal(str, int)  # path, percent of file read
+
+    def __init__(self, read, apply, workers=LOAD_WORKERS):
+        super().__init__()
+        self.read = read
+        self.apply = apply
+
+        self._order = []    # path waiting to be applied, in requested order
+        self._results = {}  # path : result arrived before its turn
+        self._callbacks = []
+        self._canceled = set()
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='EZMProjectLoader')
+        self.arrived.connect(self.deliver)
+
+    def load(self, paths, finished=None):
+        """read paths in background, finished is called once everything requested so far is applied"""
+        if finished: self._callbacks.append(finished)
+        for path in paths:
+            self._order.append(path)
+            self._executor.submit(self.run, path)
+        if not self._order: self.finish()
+
+    def is_loading(self):
+        return bool(self._order)
+
+    def cancel(self, path):
+        """ask reader to stop, the path still arrive (with LoadCanceled) to keep the order"""
+        if path in self._order: self._canceled.add(path)
+
+    def is_canceled(self, path):
+        return path in self._canceled
+
+    def report(self, path, percent):
+        """called by reader from worker thread"""
+        self.progress.emit(path, percent)
+
+    def run(self, path):
+        try:
+            result = self.read(path)
+        except Exception as e: result = e
+        self.arrived.emit(path, result)
+
+    def deliver(self, path, result):
+        self._results[path] = result
+        while self._order and self._order[0] in self._results:
+            path = self._order.pop(0)
+            self._canceled.discard(path)
+            try:
+                self.apply(path, self._results.pop(path))
+            except Exception as e: print("can't load the project: %s"%e)
+        if not self._order: self.finish()
+
+    def finish(self):
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks: callback()
+
+class FileScanner(QtCore.QObject):
+    """
+    list dropped file and folder on worker threads (folder is walked recursively), keep file with matching extension.
+    finished get list of (path, date_modified) in dropped order, a new scan or cancel drop the running one
+    """
+    arrived = QtCore.Signal(int, int, object)   # scan id, job index, found file. emitted from worker, queued to GUI thread
+
+    def __init__(self, workers=SCAN_WORKERS):
+        super().__init__()
+        self._scan_id = 0
+        self._jobs = []
+        self._remaining = 0
+        self._finished = None
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix='EZMFileScanner')
+        self.arrived.connect(self.deliver)
+
+    def scan(self, paths, extensions, finished):
+        self._scan_id += 1
+        self._finished = finished
+        chunks = [paths[index:index+SCAN_CHUNK] for index in range(0, len(paths), SCAN_CHUNK)]
+        self._jobs = [None]*len(chunks)
+        self._remaining = len(chunks)
+        for index, chunk in enumerate(chunks):
+            self._executor.submit(self.run, self._scan_id, index, chunk, tuple(extensions))
+        if not chunks: self.deliver(self._scan_id, 0, [])
+
+    def cancel(self):
+        self._scan_id += 1  # worker stop on next file, its result is ignored
+        self._finished = None
+
+    def is_scanning(self):
+        return self._finished is not None
+
+    def run(self, scan_id, index, paths, extensions):
+        found = []
+        try:
+            for path in paths:
+                if scan_id != self._scan_id: break
+                try:
+                    info = os.stat(path)
+                except OSError: continue
+                if stat.S_ISDIR(info.st_mode): self.walk(scan_id, path, extensions, found)
+                elif os.path.splitext(path)[1].lower() in extensions: found.append((path, timestamp_date(info.st_mtime)))
+        except Exception as e: print("can't scan dropped file: %s"%e)
+        self.arrived.emit(scan_id, index, found)
+
+    def walk(self, scan_id, directory, extensions, found):
+        try:
+            entries = sorted(os.scandir(directory), key=lambda entry: entry.name.lower())
+        except OSError: return
+        for entry in entries:
+            if scan_id != self._scan_id: return
+            try:
+                if entry.is_dir(): self.walk(scan_id, entry.path, extensions, found)
+                elif os.path.splitext(entry.name)[1].lower() in extensions: found.append((entry.path, timestamp_date(entry.stat().st_mtime)))
+            except OSError: continue
+
+    def deliver(self, scan_id, index, found):
+        if scan_id != self._scan_id or self._finished is None: return
+        if self._jobs: self._jobs[index] = found
+        self._remaining -= 1
+        if self._remaining > 0: return
+        finished, self._finished = self._finished, None
+        finished([entry for job in self._jobs for entry in job])
+
+class PathValidator(QtCore.QObject):
+    """
+    read folder listing of item path on QThreadPool worker (through file_status), every folder is read once by one worker.
+    item is sent back once all its folders are read, so GUI thread can eval it without touching the disk.
+    validate again or cancel drop the running job
+    """
+    validated = QtCore.Signal(int, str) # job id, folder. emitted from worker, queued to GUI thread
+
+    def __init__(self, workers=VALIDATE_WORKERS):
+        super().__init__()
+        self._job = 0
+        self._waiting = {}  # folder : item waiting for it
+        self._pending = {}  # item : number of its folder not read yet
+        self._callback = None
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(workers)
+        self.validated.connect(self.deliver)
+
+    def validate(self, items, paths, callback):
+        """paths(item) is called here on GUI thread, callback(items) get item as soon as its folders are read"""
+        self.cancel()
+        self._callback = callback
+        for item in items:
+            directories = set(os.path.dirname(os.path.normpath(path)) for path in paths(item))
+            for directory in directories: self._waiting.setdefault(directory, []).append(item)
+            if directories: self._pending[item] = len(directories)
+        for directory in self._waiting:    # in order of first item using it
+            self._pool.start(partial(self.run, self._job, directory))
+
+    def cancel(self):
+        self._job += 1  # queued worker return right away, late result is ignored
+        self._waiting = {}
+        self._pending = {}
+        self._callback = None
+
+    def is_running(self):
+        return bool(self._waiting)
+
+    def run(self, job, directory):
+        if job != self._job: return
+        try:
+            file_status.listing(directory)
+        except Exception as e: print("can't validate path: %s"%e)
+        self.validated.emit(job, directory)
+
+    def deliver(self, job, directory):
+        if job != self._job: return
+        ready = []
+        for item in self._waiting.pop(directory, []):
+            self._pending[item] -= 1
+            if not self._pending[item]:
+                del self._pending[item]
+                ready.append(item)
+        callback = self._callback
+        if not self._waiting: self._callback = None
+        if ready and callback: callback(ready)
+
+class FolderWatcher(QtCore.QObject):
+    """
+    report changed folder (file added, removed, renamed or written) through QFileSystemWatcher, folder is watched instead of
+    each file to stay under os watch limit. folder above WATCH_LIMIT or refused by the os is polled in small batch on worker thread.
+    burst of change is merged into one changed signal after WATCH_DELAY
+    """
+    changed = QtCore.Signal(list)   # folders
+    polled = QtCore.Signal(int, object) # generation, folder : listing signature. emitted from worker, queued to GUI thread
+
+    def __init__(self, delay=WATCH_DELAY, limit=WATCH_LIMIT):
+        super().__init__()
+        self.limit = limit
+        self._generation = 0    # increase when watched folders change, older poll result is ignored
+        self._watched = set()
+        self._polled = []   # folder checked by polling, in round robin order
+        self._poll_index = 0
+        self._polling = False
+        self._signatures = {}   # folder : signature from last poll
+        self._changed = set()
+
+        self._watcher = QtCore.QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self.folder_changed)
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.report)
+        self._poll_timer = QtCore.QTimer(self)
+        self._poll_timer.setInterval(POLL_INTERVAL)
+        self._poll_timer.timeout.connect(self.poll)
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self.polled.connect(self.apply_poll)
+
+    def watch(self, folders):
+        """replace watched folders, only difference is passed to the os"""
+        folders = list(OrderedDict.fromkeys(folders))
+        watched, polled = set(folders[:self.limit]), folders[self.limit:]
+        removed = [folder for folder in self._watched if folder not in watched]
+        if removed: self._watcher.removePaths(removed)
+        added = [folder for folder in watched if folder not in self._watched]
+        failed = self._watcher.addPaths(added) if added else []   # missing folder or os limit reached
+        self._watched = watched - set(failed)
+        polled += failed
+        if polled != self._polled:
+            self._generation += 1
+            self._polled = polled
+            self._poll_index = 0
+            self._signatures = {folder: signature for folder, signature in self._signatures.items() if folder in polled}
+        if self._polled and not self._poll_timer.isActive(): self._poll_timer.start()
+        elif not self._polled: self._poll_timer.stop()
+
+    def clear(self):
+        self.watch([])
+        self._changed.clear()
+        self._timer.stop()
+
+    def folder_changed(self, folder):
+        self._changed.add(folder)
+        self._timer.start()
+
+    def report(self):
+        self._watched &= set(self._watcher.directories())   # deleted folder is dropped by qt, next watch add it again or poll it
+        changed, self._changed = sorted(self._changed), set()
+        if changed: self.changed.emit(changed)
+
+    def poll(self):
+        if self._polling or not self._polled: return
+        batch = self._polled[self._poll_index:self._poll_index+POLL_BATCH]
+        self._poll_index = self._poll_index+POLL_BATCH if self._poll_index+POLL_BATCH < len(self._polled) else 0
+        self._polling = True
+        self._pool.start(partial(self.read_signatures, self._generation, batch))
+
+    def read_signatures(self, generation, folders):
+        signatures = {}
+        for folder in folders:
+            try:
+                with os.scandir(folder) as iterator:
+                    signatures[folder] = frozenset((entry.name, entry.stat().st_mtime_ns, entry.stat().st_size) for entry in iterator)
+            except OSError: signatures[folder] = None   # missing folder
+        self.polled.emit(generation, signatures)
+
+    def apply_poll(self, generation, signatures):
+        self._polling = False
+        if generation != self._generation: return
+        for folder, signature in signatures.items():
+            if folder in self._signatures and self._signatures[folder] != signature: self.folder_changed(folder)
+            self._signatures[folder] = signature   # first poll only record the folder
+
+def thumbnail_path(path, size, mtime_ns):
+    """downscaled copy of image inside .thumbnail next to it, name carry size and source modified time"""
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), THUMBNAIL_FOLDER, '%s.%s.%s.png'%(name, size, mtime_ns))
+
+class ThumbnailLoader(QtCore.QObject):
+    """
+    decode preview on QThreadPool worker at the size it's shown (QImageReader.setScaledSize), result is kept in
+    icon_cache and in .thumbnail folder so the full image is decoded once per change. only the latest request is delivered,
+    request passed by while clicking through asset is dropped before it's decoded
+    """
+    loaded = QtCore.Signal(int, str, int, object, object)   # job id, path, size, stamp, QImage. emitted from worker, queued to GUI thread
+
+    def __init__(self, workers=THUMBNAIL_WORKERS):
+        super().__init__()
+        self._job = 0
+        self._callback = None
+        self._pool = QtCore.QThreadPool(self)
+        self._pool.setMaxThreadCount(workers)
+        self.loaded.connect(self.deliver)
+
+    def load(self, path, size, callback):
+        """callback(path, pixmap) on GUI thread, pixmap fit in size x size"""
+        self._job += 1
+        self._callback = callback
+        self._pool.start(partial(self.run, self._job, path, size))
+
+    def cancel(self):
+        self._job += 1
+        self._callback = None
+
+    def run(self, job, path, size):
+        if job != self._job: return # newer preview requested
+        try:
+            stamp = icon_cache.stamp(path)
+            image = self.read(path, size, stamp)
+        except Exception as e:
+            print("can't load preview: %s"%e)
+            return
+        self.loaded.emit(job, path, size, stamp, image)
+
+    def read(self, path, size, stamp):
+        if stamp is None: return QtGui.QImage()
+        thumbnail = thumbnail_path(path, size, stamp[0])
+        image = QtGui.QImage(thumbnail) if os.path.exists(thumbnail) else QtGui.QImage()
+        if not image.isNull(): return image
+        reader = QtGui.QImageReader(path)
+        scaled = reader.size().scaled(size, size, QtCore.Qt.KeepAspectRatio)
+        if scaled.isValid(): reader.setScaledSize(scaled)  # decoder scale while reading, full image is never kept
+        image = reader.read()
+        if image.isNull(): return image
+        self.save(path, thumbnail, image)
+        return image
+
+    def save(self, path, thumbnail, image):
+        """write thumbnail and remove the one made from older version of the image"""
+        folder = os.path.dirname(thumbnail)
+        prefix = os.path.basename(thumbnail).rsplit('.', 2)[0] + '.'   # name.size.
+        try:
+            os.makedirs(folder, exist_ok=True)
+            image.save(thumbnail)
+            for name in os.listdir(folder):
+                if name.startswith(prefix) and name != os.path.basename(thumbnail) and name[len(prefix):-4].isdigit(): os.remove(os.path.join(folder, name))
+        except OSError as e: print("can't save thumbnail: %s"%e)    # read-only project, preview still shown
+
+    def deliver(self, job, path, size, stamp, image):
+        if image.isNull(): pixmap = None
+        else: pixmap = icon_cache.insert(path, (size, size), image, stamp=stamp)    # older job still fill the cache
+        if job != self._job: return
+        callback, self._callback = self._callback, None
+        if callback: callback(path, pixmap)
+
+class ProjectJournal(object):
+    """
+    append only change log next to project json (json line per change), the snapshot is only rewritten on compaction.
+    first line tie the journal to the snapshot it applies on, asset is identified by record uid.
+    all write run on save scheduler worker, one job at a time
+    """
+    def __init__(self, path):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self.last_compact = time.time()
+        self.saved = {} # uid : revision already in snapshot or journal
+        self.header = None
+
+    def snapshot_id(self):
+        info = os.stat(self.path)
+        return [info.st_size, info.st_mtime_ns]
+
+    def mark_saved(self, project):
+        self.saved = {record.uid: record.revision for record in project.asset}
+        self.header = project.header()
+
+    def replay(self, project):
+        """apply journal on freshly loaded project record, stop at broken line (crash while writing). return True if applied"""
+        if not os.path.exists(self.journal_path): return False
+        with open(self.journal_path, 'r') as file:
+            lines = file.read().split('\n')
+        records = OrderedDict((record.uid, record) for record in project.asset)
+        for index, line in enumerate(lines):
+            if not line.strip(): continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                print('WARNING: journal %s broken at line %s, ignore the rest'%(self.journal_path, index+1))
+                break
+            if index == 0:
+                if entry.get('op') != 'base' or entry['snapshot'] != self.snapshot_id():
+                    print('WARNING: journal %s does not match snapshot, ignored'%self.journal_path)
+                    return False
+            elif entry['op'] == 'project':
+                project.name = entry['data']['name']
+                project.category = entry['data']['category']
+                project.path = entry['data']['path']
+                project.thumbnail = entry['data']['thumbnail']
+            elif entry['op'] == 'put':
+                record_class = StructRecord if 'file' in entry['data'] else AssetRecord
+                record = record_class.from_dict(entry['data'])
+                record.uid = entry['uid']
+                records[record.uid] = record    # replaced record keep its position
+            elif entry['op'] == 'del':
+                records.pop(entry['uid'], None)
+        project.asset = list(records.values())
+        project.next_uid = max(list(records.keys())+[project.next_uid-1]) + 1
+        if DEBUG: print('journal replayed > %s'%self.journal_path)
+        return True
+
+    def need_compact(self):
+        if not os.path.exists(self.journal_path): return False
+        if os.path.getsize(self.journal_path) > JOURNAL_COMPACT_SIZE: return True
+        return time.time() - self.last_compact > JOURNAL_COMPACT_TIME
+
+    def write(self, project):
+        """append change since last write, or compact when journal is too big/old"""
+        if not os.path.exists(self.path) or self.need_compact():
+            self.compact(project)
+            return
+        entries = []
+        saved = {}
+        header = project.header()
+        if header != self.header: entries.append(OrderedDict([('op', 'project'), ('data', header)]))
+        for record in list(project.asset):
+            if record.uid is None:  # new asset
+                record.uid = project.next_uid
+                project.next_uid += 1
+            revision = record.revision  # read first, change made while writing is written next time
+            saved[record.uid] = revision
+            if self.saved.get(record.uid) != revision: entries.append(OrderedDict([('op', 'put'), ('uid', record.uid), ('data', record.cached_dict())]))
+        for uid in self.saved:
+            if uid not in saved: entries.append(OrderedDict([('op', 'del'), ('uid', uid)]))
+        if not entries: return
+
+        new_journal = not os.path.exists(self.journal_path)
+        with open(self.journal_path, 'a') as file:
+            if new_journal: file.write(json.dumps(OrderedDict([('op', 'base'), ('snapshot', self.snapshot_id())]))+'\n')
+            for entry in entries: file.write(json.dumps(entry, separators=(',', ':'))+'\n')
+            file.flush()
+            os.fsync(file.fileno())
+        self.saved = saved
+        self.header = header
+
+    def compact(self, project):
+        """rewrite full snapshot then drop the journal, uid renumbered like loading the new snapshot"""
+        header = project.header()
+        asset = list(project.asset)
+        revisions = [record.revision for record in asset]
+        write_json_atomic(self.path, project.to_dict(asset))
+        revision_of = dict(zip(map(id, asset), revisions))
+        self.saved = {record.uid: revision_of[id(record)] for record in project.number_asset(asset)}
+        self.header = header
+        if os.path.exists(self.journal_path): os.remove(self.journal_path)
+        self.last_compact = time.time()
+        if DEBUG: print('journal compacted > %s'%self.path)
+
+def due_day(record):
+    """due date of assignment as day number, indexed so assignment can be queried by date"""
+    if len(record.date_assignment) != 2: return None
+    try:
+        return datetime.strptime(record.date_assignment[1], '%d/%m/%Y').toordinal()
+    except (TypeError, ValueError):
+        return None
+
+class SQLiteProjectStore(object):
+    """
+    project data kept in indexed table of one sqlite database, project json stay as import/export format for sharing.
+    project is read from database while its json is unchanged since last sync, only row of changed asset is written.
+    used from main thread (loading, query) and save scheduler worker (writing), every access hold the lock
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.state = {} # project file : {'id', 'saved' {uid: revision}, 'header', 'order', 'changed' (not exported to json yet)}
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self.migrate()
+
+    def migrate(self):
+        """bring database made by older version up to STORE_VERSION, new database is created at current version"""
+        version = self._db.execute('PRAGMA user_version').fetchone()[0]
+        if version >= STORE_VERSION: return
+        if self._db.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='project'").fetchone():
+            for step in range(version+1, STORE_VERSION+1): self._db.executescript(STORE_MIGRATION[step])
+        self._db.executescript(STORE_SCHEMA)
+        self._db.execute('PRAGMA user_version=%d'%STORE_VERSION)
+
+    def snapshot_id(self, file):
+        info = os.stat(file)
+        return '%s:%s'%(info.st_size, info.st_mtime_ns)
+
+    def is_current(self, file):
+        """True if database has the project and its json is not changed outside since last sync"""
+        if not os.path.exists(file): return False
+        with self._lock:
+            row = self._db.execute('SELECT snapshot FROM project WHERE file=?', (file,)).fetchone()
+        return row is not None and row[0] == self.snapshot_id(file)
+
+    def load(self, file):
+        """read project with assigned asset only, the rest is read when project asset is accessed"""
+        with self._lock:
+            project_id, name, category, path, thumbnail, changed = self._db.execute('SELECT id, name, category, path, thumbnail, changed FROM project WHERE file=?', (file,)).fetchone()
+            assigned = self.read_asset(project_id, 'AND due IS NOT NULL')
+            last_uid = self._db.execute('SELECT MAX(uid) FROM asset WHERE project=?', (project_id,)).fetchone()[0]
+            project = ProjectRecord(name, category, path, thumbnail, assigned, loader=lambda known: self.load_asset(file, known))
+            project.next_uid = last_uid + 1 if last_uid is not None else 0
+            self.state[file] = {'id': project_id,
+                                'saved': {record.uid: record.revision for record in assigned},
+                                'header': project.header(),
+                                'order': None,  # unknown until every asset is read
+                                'changed': bool(changed)}   # left by session that ended before export
+        if DEBUG: print('project read from database > %s'%file)
+        return project
+
+    def load_asset(self, file, known):
+        """read every asset of project in display order, record already read (assigned asset) is reused"""
+        with self._lock:
+            state = self.state[file]
+            known = {record.uid: record for record in known}
+            asset = [known.get(record.uid, record) for record in self.read_asset(state['id'])]
+            for record in asset: state['saved'].setdefault(record.uid, record.revision)
+            state['order'] = [record.uid for record in asset]
+        return asset
+
+    def read_asset(self, project_id, where=''):
+        versions = {}
+        for row in self._db.execute('SELECT uid, name, path, asset_group, date_modified, type, status FROM version WHERE project=? AND uid IN '
+                                    '(SELECT uid FROM asset WHERE project=? %s) ORDER BY uid, position'%where, (project_id, project_id)):
+            versions.setdefault(row[0], []).append(VersionRecord(*row[1:]))
+        asset = []
+        for row in self._db.execute('SELECT asset.uid, name, path, asset_group, date_modified, type, status, date_assignment, preview, notes, struct.file FROM asset '
+                                    'LEFT JOIN struct ON struct.project=asset.project AND struct.uid=asset.uid WHERE asset.project=? %s ORDER BY position'%where, (project_id,)):
+            uid, name, path, group, date_modified, type, status, date_assignment, preview, notes, struct_file = row
+            if struct_file is None: record = AssetRecord(name, path, group, date_modified, type, status, json.loads(date_assignment), preview, notes)
+            else: record = StructRecord(name, path, group, date_modified, type, status, struct_file, json.loads(date_assignment), preview, notes, versions.get(uid, []))
+            record.uid = uid
+            asset.append(record)
+        return asset
+
+    def put_asset(self, project_id, record, position=None):
+        """insert or update row of asset, position None keep current position"""
+        self._db.execute('INSERT INTO asset VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?) ON CONFLICT (project, uid) DO UPDATE SET position=COALESCE(excluded.position, position), '
+                         'name=excluded.name, path=excluded.path, asset_group=excluded.asset_group, date_modified=excluded.date_modified, type=excluded.type, status=excluded.status, '
+                         'date_assignment=excluded.date_assignment, due=excluded.due, preview=excluded.preview, notes=excluded.notes',
+                         (project_id, record.uid, position, record.name, record.path, record.group, record.date_modified, record.type, record.status,
+                          json.dumps(record.date_assignment), due_day(record), record.preview, record.notes))
+        if type(record) is StructRecord:
+            self._db.execute('INSERT OR REPLACE INTO struct VALUES (?,?,?)', (project_id, record.uid, record.file))
+            self._db.execute('DELETE FROM version WHERE project=? AND uid=?', (project_id, record.uid))
+            self._db.executemany('INSERT INTO version VALUES (?,?,?,?,?,?,?,?,?)',
+                                 [(project_id, record.uid, index, version.name, version.path, version.group, version.date_modified, version.type, version.status)
+                                  for index, version in enumerate(record.file_version)])
+
+    def delete_asset(self, project_id, uids):
+        for table in ('asset', 'struct', 'version'):
+            self._db.executemany('DELETE FROM %s WHERE project=? AND uid=?'%table, [(project_id, uid) for uid in uids])
+
+    def import_project(self, file, project):
+        """replace database content of project with the record (read from json)"""
+        with self._lock, self._db:
+            header = project.header()
+            row = self._db.execute('SELECT id FROM project WHERE file=?', (file,)).fetchone()
+            if row:
+                project_id = row[0]
+                self._db.execute('UPDATE project SET name=?, category=?, path=?, thumbnail=? WHERE id=?', tuple(header.values())+(project_id,))
+                self.delete_asset(project_id, [uid for uid, in self._db.execute('SELECT uid FROM asset WHERE project=?', (project_id,))])
+            else:
+                project_id = self._db.execute('INSERT INTO project (file, name, category, path, thumbnail) VALUES (?,?,?,?,?)', (file,)+tuple(header.values())).lastrowid
+            asset = list(project.asset)
+            saved = {}
+            for position, record in enumerate(asset):
+                if record.uid is None:
+                    record.uid = project.next_uid
+                    project.next_uid += 1
+                saved[record.uid] = record.revision
+                self.put_asset(project_id, record, position)
+            self._db.execute('UPDATE project SET snapshot=?, changed=0 WHERE id=?', (self.snapshot_id(file) if os.path.exists(file) else None, project_id))
+            self.state[file] = {'id': project_id, 'saved': saved, 'header': header, 'order': [record.uid for record in asset], 'changed': False}
+        if DEBUG: print('project imported to database > %s'%file)
+
+    def write(self, file, project):
+        """write header and asset changed since last write, project not fully read only update its read asset"""
+        with self._lock:
+            state = self.state.get(file)
+            if state is None:
+                self.import_project(file, project)
+                return
+            project_id = state['id']
+            loaded = project.is_loaded()
+            asset = list(project.loaded_asset())
+            header = project.header()
+            saved = {}
+            changed = []
+            for position, record in enumerate(asset):
+                if record.uid is None:  # new asset
+                    record.uid = project.next_uid
+                    project.next_uid += 1
+                revision = record.revision  # read first, change made while writing is written next time
+                saved[record.uid] = revision
+                if state['saved'].get(record.uid) != revision: changed.append((record, position if loaded else None))
+            deleted = [uid for uid in state['saved'] if uid not in saved] if loaded else []
+            order = [record.uid for record in asset] if loaded else state['order']
+            if header == state['header'] and not changed and not deleted and order == state['order']: return
+
+            with self._db:
+                if header != state['header']: self._db.execute('UPDATE project SET name=?, category=?, path=?, thumbnail=? WHERE id=?', tuple(header.values())+(project_id,))
+                for record, position in changed: self.put_asset(project_id, record, position)
+                self.delete_asset(project_id, deleted)
+                if order != state['order']:    # reorder only update position
+                    self._db.executemany('UPDATE asset SET position=? WHERE project=? AND uid=?', [(position, project_id, uid) for position, uid in enumerate(order)])
+                if not state['changed']: self._db.execute('UPDATE project SET changed=1 WHERE id=?', (project_id,))  # kept if app end before export
+            if not loaded: saved = {**state['saved'], **saved}  # keep revision of asset not read yet
+            state.update(saved=saved, header=header, order=order, changed=True)
+
+    def export(self, file, project):
+        """write pending change then rewrite project json if database changed, so the json can be shared"""
+        with self._lock:
+            self.write(file, project)
+            state = self.state[file]
+            if not state['changed']: return
+            write_json_atomic(file, project.to_dict())
+            with self._db: self._db.execute('UPDATE project SET snapshot=?, changed=0 WHERE id=?', (self.snapshot_id(file), state['id']))
+            state['changed'] = False
+        if DEBUG: print('project exported from database > %s'%file)
+
+    def query_asset(self, file, group=None, sorter=None):
+        """uid of project asset in group (every group if None) ordered by sorter (display order if None), answered from index"""
+        where, args = 'project=?', [self.state[file]['id']]
+        if group is not None:
+            where += ' AND asset_group=?'
+            args.append(group)
+        order = STORE_SORT[sorter] + ', position' if sorter else 'position'
+        with self._lock:
+            return [uid for uid, in self._db.execute('SELECT uid FROM asset WHERE %s ORDER BY %s'%(where, order), args)]
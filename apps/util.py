@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from PySide6 import QtCore, QtWidgets, QtGui
 
 import os 
@@ -6,6 +7,7 @@ main_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..')
 icon_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', 'sources', 'icons')
 
 INVALID_FILENAME_CHARACTERS = ['\\','/',':','*','?','"','<','>','|']
+ICON_CACHE_BYTES = 32*1024*1024 # scaled pixmap kept by icon_cache before least recently used is dropped
 
 # # verify intergrity with file browser
 # def verify_file_integrity(path):
@@ -78,6 +80,58 @@ def add_filename_suffix(filename, suffix=''):
     name = name + suffix
     return name + "." + ext
 
+# existence, size and modified time of file served from one os.scandir per parent directory,
+# listing is kept until invalidated (folder watcher report change of watched and polled folder) so evaluating thousands of asset read each folder once
+class FileStatus(object):
+    def __init__(self):
+        self._directories = {}  # normcase directory : {normcase name : DirEntry}
+
+    def listing(self, directory):
+        key = os.path.normcase(directory)
+        entries = self._directories.get(key)
+        if entries is None:
+            entries = {}
+            try:
+                with os.scandir(directory or '.') as iterator:
+                    for entry in iterator: entries[os.path.normcase(entry.name)] = entry
+            except OSError: pass    # missing or unreadable folder, everything inside is missing
+            self._directories[key] = entries
+        return entries
+
+    def exists(self, path):
+        if not path: return False
+        directory, name = os.path.split(os.path.normpath(path))
+        if not name or name == '..': return os.path.exists(path)   # drive or root, has no parent listing
+        return os.path.normcase(name) in self.listing(directory)
+
+    # os.stat_result of path, None if missing
+    def stat(self, path):
+        if not self.exists(path): return None
+        directory, name = os.path.split(os.path.normpath(path))
+        entry = self.listing(directory).get(os.path.normcase(name))
+        try:
+            return entry.stat() if entry else os.stat(path)   # DirEntry keep its stat, on windows it's read with the listing
+        except OSError: return None
+
+    def size(self, path):
+        status = self.stat(path)
+        return status.st_size if status else None
+
+    def mtime(self, path):
+        status = self.stat(path)
+        return status.st_mtime if status else None
+
+    # forget folder holding path (and path itself if it's a folder), everything if path is None
+    def invalidate(self, path=None):
+        if path is None:
+            self._directories.clear()
+            return
+        path = os.path.normpath(path)
+        self._directories.pop(os.path.normcase(os.path.dirname(path)), None)
+        self._directories.pop(os.path.normcase(path), None)
+
+file_status = FileStatus()
+
 # return main directory if no argument passed
 def get_path(*args, icon=False):
     path = main_path
@@ -94,6 +148,14 @@ def loadStylesheet(instance, filename):
         _style = file.read()
         instance.setStyleSheet(_style)
 
+# set dynamic property read by selector in dark.qss (ex. InteractiveItem#selectiveFrame[state="hovered"]),
+# widget is polished again only when the value changed instead of parsing a new stylesheet every time
+def set_style_property(widget, name, value):
+    if widget.property(name) == value: return
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
 # validate image from giver directory path
 def can_read_image(path):
     validator = QtGui.QImageReader(path)
@@ -103,14 +165,14 @@ def can_read_image(path):
         return False
     
 def validate_image_path(path, backup=get_path("image_not_found.png", icon=True)):  
-    if path and can_read_image(path):
-        return QtGui.QImage(path)
-    else:
-        try:
-            return QtGui.QImage(backup)
-        except Exception as e: 
-            print("backup icon not found! #validate_image_path function")
-            print(e)
+    if path:
+        image = QtGui.QImageReader(path).read()   # open and decode once, null image if it can't be read
+        if not image.isNull(): return image
+    try:
+        return QtGui.QImage(backup)
+    except Exception as e: 
+        print("backup icon not found! #validate_image_path function")
+        print(e)
 
 def create_rotated_icon(image_path, angle):
     if can_read_image(image_path):
@@ -120,6 +182,65 @@ def create_rotated_icon(image_path, angle):
         transform = QtGui.QTransform().rotate(angle)
         rotated_pixmap = pixmap.transformed(transform)
         return QtGui.QIcon(rotated_pixmap)
+
+# decoded and scaled image shared as one QPixmap by every widget showing the same (path, size, aspect mode).
+# icon inside sources/icons never change so it's not read again, other image (thumbnail, screenshot) is read again when its file changed
+class PixmapCache(object):
+    def __init__(self, max_bytes=ICON_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._pixmaps = OrderedDict()   # (path, width, height, aspect mode, backup) : (file stamp, pixmap), least recently used first
+        self._icon_dir = os.path.normcase(os.path.normpath(icon_path)) + os.sep
+
+    # modified time and size of image, 0 for app icon, None if missing
+    def stamp(self, path):
+        if not path: return None
+        if os.path.normcase(os.path.normpath(path)).startswith(self._icon_dir): return 0
+        try:
+            status = os.stat(path)
+        except OSError: return None
+        return (status.st_mtime_ns, status.st_size)
+
+    def pixmap(self, path, size, aspect_mode=QtCore.Qt.KeepAspectRatio, backup=None):
+        pixmap = self.find(path, size, aspect_mode, backup)
+        if pixmap is None:
+            image = validate_image_path(path, backup) if backup else validate_image_path(path)
+            pixmap = self.insert(path, size, image.scaled(size[0], size[1], aspect_mode, QtCore.Qt.SmoothTransformation), aspect_mode, backup)
+        return pixmap
+
+    # cached pixmap still matching its file, None if it has to be read
+    def find(self, path, size, aspect_mode=QtCore.Qt.KeepAspectRatio, backup=None):
+        key = (path, size[0], size[1], aspect_mode, backup)
+        cached = self._pixmaps.get(key)
+        if cached is None: return None
+        if cached[0] != self.stamp(path):
+            self.drop(key)
+            return None
+        self._pixmaps.move_to_end(key)
+        return cached[1]
+
+    # add image already scaled to size (decoded by worker), stamp is taken when the file was read
+    def insert(self, path, size, image, aspect_mode=QtCore.Qt.KeepAspectRatio, backup=None, stamp=False):
+        key = (path, size[0], size[1], aspect_mode, backup)
+        if key in self._pixmaps: self.drop(key)
+        pixmap = QtGui.QPixmap.fromImage(image)
+        self._pixmaps[key] = (self.stamp(path) if stamp is False else stamp, pixmap)
+        self.bytes += self.pixmap_bytes(pixmap)
+        while self.bytes > self.max_bytes and len(self._pixmaps) > 1: self.drop(next(iter(self._pixmaps)))
+        return pixmap
+
+    def drop(self, key):
+        stamp, pixmap = self._pixmaps.pop(key)
+        self.bytes -= self.pixmap_bytes(pixmap)
+
+    def pixmap_bytes(self, pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def clear(self):
+        self._pixmaps.clear()
+        self.bytes = 0
+
+icon_cache = PixmapCache()
     
 # warning messagebox
 def warning_path_not_exist(parent=None, path=''):
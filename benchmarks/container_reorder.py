@@ -0,0 +1,69 @@
+"""
+sorting item widget inside InteractiveItemContainer: insertWidget per item against a single reorder.
+run from repository root: python benchmarks/container_reorder.py [--sizes 1000 5000 10000]
+set QT_QPA_PLATFORM=offscreen to run without a display
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'apps'))
+
+from PySide6 import QtWidgets
+
+from custom_widget import InteractiveItemContainer
+
+def make_container(count):
+    """container inside scroll area like project browser, only visible item is painted"""
+    container = InteractiveItemContainer()
+    for index in range(count):
+        container.main_layout.addWidget(QtWidgets.QLabel('item_%05d'%index))
+    scroll = QtWidgets.QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(container)
+    scroll.resize(400, 800)
+    scroll.show()
+    QtWidgets.QApplication.processEvents()
+    return scroll, container
+
+def shuffled(container):
+    items = container.get_all_item()
+    random.shuffle(items)
+    return items
+
+def insert_each(container, items):
+    """previous way: move every widget with insertWidget"""
+    for index, item in enumerate(items):
+        if container.main_layout.indexOf(item) != index: container.main_layout.insertWidget(index, item)
+
+def measure(container, sort):
+    items = sorted(shuffled(container), key=lambda item: item.text())
+    start = time.perf_counter()
+    sort(container, items)
+    QtWidgets.QApplication.processEvents()  # include the relayout and repaint
+    elapsed = time.perf_counter() - start
+    assert container.get_all_item() == items
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000])
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    random.seed(0)
+    print('%8s %12s %12s'%('items', 'insertWidget', 'reorder'))
+    for count in args.sizes:
+        scroll, container = make_container(count)
+        container.reorder(shuffled(container))
+        before = measure(container, insert_each)
+        container.reorder(shuffled(container))
+        after = measure(container, lambda container, items: container.reorder(items))
+        print('%8s %11.3fs %11.3fs'%(count, before, after))
+        scroll.deleteLater()
+        QtWidgets.QApplication.processEvents()
+
+if __name__ == '__main__':
+    main()
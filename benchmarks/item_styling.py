@@ -0,0 +1,112 @@
+"""
+hover and refresh cost of 2k item rows styled through setStyleSheet per state change against dynamic property in dark.qss.
+run from repository root: python benchmarks/item_styling.py [--rows 2000] [--rounds 3]
+set QT_QPA_PLATFORM=offscreen to run without a display
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'apps'))
+
+from PySide6 import QtCore, QtWidgets, QtGui
+
+from custom_widget import InteractiveItemContainer, InteractiveItem
+from util import get_path, loadStylesheet, set_style_property
+
+BORDER = {'selected': '#FFA500', 'hovered': '#1363bf', '': '#101010'}
+
+class StyleSheetItem(InteractiveItem):
+    """previous way: new stylesheet for every hover and selection change"""
+    def paintBorder(self):
+        if self.selected: state = 'selected'
+        elif self.hovered: state = 'hovered'
+        else: state = ''
+        self.setStyleSheet('InteractiveItem#selectiveFrame{border: 1px solid %s}'%BORDER[state])
+
+def make_rows(item_class, count):
+    container = InteractiveItemContainer()
+    items = []
+    for index in range(count):
+        item = item_class()
+        item.main_layout.addWidget(QtWidgets.QLabel('item_%05d'%index))
+        container.add_item(item)
+        items.append(item)
+    scroll = QtWidgets.QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(container)
+    scroll.resize(400, 800)
+    scroll.show()
+    QtWidgets.QApplication.processEvents()
+    return scroll, items
+
+def hover(items, rounds):
+    """mouse passing over every row"""
+    enter = QtGui.QEnterEvent(QtCore.QPointF(), QtCore.QPointF(), QtCore.QPointF())
+    leave = QtCore.QEvent(QtCore.QEvent.Leave)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            item.enterEvent(enter)
+            item.leaveEvent(leave)
+        QtWidgets.QApplication.processEvents()
+    return time.perf_counter() - start
+
+def refresh(frames, set_missing, rounds, toggle):
+    """eval of every version row, toggle=False is the common case where nothing changed"""
+    start = time.perf_counter()
+    for index in range(rounds):
+        for frame in frames: set_missing(frame, toggle and index%2 == 0)
+        QtWidgets.QApplication.processEvents()
+    return time.perf_counter() - start
+
+def stylesheet_missing(frame, missing):
+    frame.setStyleSheet('QFrame#assetVersion{border: 1px solid %s}'%('crimson' if missing else '#505050'))
+
+def property_missing(frame, missing):
+    set_style_property(frame, 'missing', missing)
+
+def make_frames(count):
+    container = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(container)
+    frames = []
+    for index in range(count):
+        frame = QtWidgets.QFrame()
+        frame.setObjectName('assetVersion')
+        QtWidgets.QHBoxLayout(frame).addWidget(QtWidgets.QLabel('v%03d'%index))
+        layout.addWidget(frame)
+        frames.append(frame)
+    scroll = QtWidgets.QScrollArea()
+    scroll.setWidgetResizable(True)
+    scroll.setWidget(container)
+    scroll.resize(400, 800)
+    scroll.show()
+    QtWidgets.QApplication.processEvents()
+    return scroll, frames
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=3)
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv)
+    loadStylesheet(app, get_path('sources', 'style', 'dark.qss'))
+
+    print('%s rows, %s rounds'%(args.rows, args.rounds))
+    print('%-18s %12s %12s'%('', 'setStyleSheet', 'property'))
+    before_scroll, before = make_rows(StyleSheetItem, args.rows)
+    after_scroll, after = make_rows(InteractiveItem, args.rows)
+    print('%-18s %11.3fs %11.3fs'%('hover', hover(before, args.rounds), hover(after, args.rounds)))
+    before_scroll.deleteLater(); after_scroll.deleteLater()
+
+    before_scroll, before = make_frames(args.rows)
+    after_scroll, after = make_frames(args.rows)
+    for toggle in (False, True):
+        print('%-18s %11.3fs %11.3fs'%('refresh (%s)'%('toggled' if toggle else 'unchanged'),
+                                        refresh(before, stylesheet_missing, args.rounds, toggle),
+                                        refresh(after, property_missing, args.rounds, toggle)))
+
+if __name__ == '__main__':
+    main()
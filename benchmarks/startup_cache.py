@@ -0,0 +1,95 @@
+"""
+cold and warm startup read of project files, with and without the snapshot cache (data/cache).
+run from repository root: python benchmarks/startup_cache.py [--projects 20] [--assets 5000]
+everything is written to a temporary folder, user data is not touched
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'apps'))
+
+import storage
+from storage import SnapshotCache, read_project_file
+
+storage.DEBUG = False
+
+GROUPS = ['Character', 'Prop', 'Sets', 'Other']
+TYPES = ['.ma', '.mb', '.fbx', '.obj', '.png']
+
+def make_asset(index, root):
+    type = random.choice(TYPES)
+    return {'name': 'asset_%05d'%index,
+            'path': os.path.join(root, 'dir%02d'%(index%20), 'asset_%05d%s'%(index, type)),
+            'group': random.choice(GROUPS),
+            'date_modified': '%02d/%02d/2024 %02d:%02d'%(random.randint(1, 28), random.randint(1, 12), random.randint(0, 23), random.randint(0, 59)),
+            'type': type,
+            'status': random.randint(0, 2),
+            'date_assignment': ['01/01/2025', '%02d/06/2025'%random.randint(1, 28)] if index%10 == 0 else [],
+            'preview': '',
+            'notes': 'note %s'%index}
+
+def make_version(index, version, root):
+    data = make_asset(index, root)
+    data['name'] = 'v%03d'%version
+    return {key: data[key] for key in ('name', 'path', 'group', 'date_modified', 'type', 'status')}
+
+def make_project(path, asset_count):
+    root = os.path.dirname(path)
+    asset = [make_asset(index, root) for index in range(asset_count)]
+    struct = []
+    for index in range(asset_count//10):
+        data = make_asset(asset_count+index, root)
+        data['file'] = data['path']
+        data['path'] = os.path.dirname(data['path'])
+        data['file_version'] = [make_version(index, version, root) for version in range(3)]
+        struct.append(data)
+    with open(path, 'w') as file:
+        file.write(json.dumps({'name': os.path.basename(root), 'category': 'Other', 'path': root, 'thumbnail': '', 'asset': asset, 'struct': struct}, indent=4))
+
+def read_all(paths, cache):
+    """same path as project loader: cache first, parse json and fill cache when missing"""
+    start = time.perf_counter()
+    for path in paths:
+        record = cache.load(path)
+        if record is None:
+            snapshot = cache.snapshot_id(path)
+            record = read_project_file(path)
+            cache.store(path, record, snapshot)
+    return time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--projects', type=int, default=20)
+    parser.add_argument('--assets', type=int, default=5000)
+    args = parser.parse_args()
+
+    random.seed(0)
+    directory = tempfile.mkdtemp(prefix='ezm_benchmark_')
+    try:
+        paths = []
+        for index in range(args.projects):
+            project_dir = os.path.join(directory, 'project%02d'%index)
+            os.makedirs(project_dir)
+            paths.append(os.path.join(project_dir, 'project.json'))
+            make_project(paths[-1], args.assets)
+        size = sum(os.path.getsize(path) for path in paths)/1024/1024
+        print('%s project, %s asset each, %.1f MB json'%(args.projects, args.assets, size))
+
+        start = time.perf_counter()
+        for path in paths: read_project_file(path)
+        print('json only       %.3fs'%(time.perf_counter()-start))
+
+        cache_dir = os.path.join(directory, 'cache')
+        print('cold (no cache) %.3fs'%read_all(paths, SnapshotCache(cache_dir)))
+        print('warm (cached)   %.3fs'%read_all(paths, SnapshotCache(cache_dir)))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()